@@ -5,42 +5,386 @@ GitHub 릴리즈 전 모든 체크리스트 항목을 자동으로 검증합니
 """
 
 import os
+import re
+import ast
+import mmap
 import sys
 import json
-import subprocess
 import time
+import argparse
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
-# import requests  # Optional dependency
+from dataclasses import dataclass, asdict
 from datetime import datetime
-import tempfile
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+try:
+    import pathspec  # 선택 의존성: .gitignore 기반 가지치기
+except ImportError:
+    pathspec = None
+
+try:
+    import orjson  # 선택 의존성: 빠른 JSON 직렬화
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # 선택 의존성: 다중 패턴 단일 스캔
+except ImportError:
+    ahocorasick = None
+
+_MB = 1 << 20
+
+# version = "2.0.0" 패턴
+_VERSION_RE = re.compile(r'version\s*=\s*["\']([^"\']+)["\']')
+
+# 민감한 정보 검사 패턴들
+_SENSITIVE_PATTERNS = [
+    (r'password\s*=\s*["\'][^"\']*["\']', '하드코딩된 패스워드'),
+    (r'api_key\s*=\s*["\'][^"\']*["\']', 'API 키'),
+    (r'secret\s*=\s*["\'][^"\']*["\']', '시크릿 키'),
+    (r'token\s*=\s*["\'][^"\']*["\']', '토큰'),
+    # 숫자나 +, /, = 가 하나도 없는 값은 클래스명 같은 일반 식별자이므로 제외
+    (r'["\'](?=[A-Za-z0-9+/]*[0-9+/=])[A-Za-z0-9+/]{20,}={0,2}["\']', 'Base64 인코딩된 시크릿')
+]
+
+# 패턴별로 한 번만 컴파일 - 하나의 alternation으로 합치면 겹치는 구간을 앞선 패턴이
+# 소비해 뒤 패턴(예: 따옴표 안의 Base64 값)이 보고되지 않으므로 카테고리마다 따로 검색한다
+_SECURITY_PATTERNS = [(re.compile(pattern, re.IGNORECASE), description)
+                      for pattern, description in _SENSITIVE_PATTERNS]
+
+# README 필수 섹션 (소문자 비교)
+_README_SECTIONS = [
+    ('# ', '제목'),
+    ('## ', '섹션 헤더'),
+    ('install', '설치 가이드'),
+    ('usage', '사용법'),
+    ('example', '예제')
+]
+
+# Dockerfile 필수 요소 (대소문자 구분, mmap 바이트 검색)
+_DOCKERFILE_ELEMENTS = [
+    (b'FROM', '베이스 이미지'),
+    (b'COPY', '파일 복사'),
+    (b'RUN', '명령 실행'),
+    (b'EXPOSE', '포트 노출'),
+    (b'CMD', '실행 명령')
+]
+
+def _build_automaton(patterns: List[Tuple[str, str]]):
+    """패턴 목록으로 Aho-Corasick 오토마톤 생성 (pyahocorasick 미설치 시 None)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (pattern, _) in enumerate(patterns):
+        automaton.add_word(pattern, index)
+    automaton.make_automaton()
+    return automaton
+
+_README_AUTOMATON = _build_automaton(_README_SECTIONS)
+
+def _match_patterns(content: str, patterns: List[Tuple[str, str]], automaton=None) -> set:
+    """content에 포함된 패턴 인덱스 집합 - 오토마톤이 있으면 1회 선형 스캔"""
+    if automaton is None:
+        return {index for index, (pattern, _) in enumerate(patterns) if pattern in content}
+    return {index for _, index in automaton.iter(content)}
+
+# 보안 검사 시 내려가지 않을 디렉토리
+_SKIP_DIRS = frozenset({'venv', '.venv', '__pycache__', '.git', 'node_modules'})
+
+def _find_sensitive(content: str) -> List[str]:
+    """내용에서 발견된 민감한 정보 카테고리 설명 목록 (_SENSITIVE_PATTERNS 순서)"""
+    return [description for pattern, description in _SECURITY_PATTERNS if pattern.search(content)]
+
+def _load_gitignore(path: str = '.gitignore'):
+    """.gitignore를 PathSpec으로 로드 (pathspec 미설치 또는 파일 없음이면 None)"""
+    if pathspec is None:
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return pathspec.PathSpec.from_lines('gitwildmatch', f.read().splitlines())
+    except OSError:
+        return None
+
+def _iter_py_files(root: str = '.', skip: frozenset = _SKIP_DIRS, ignore=None):
+    """os.scandir 기반 .py 파일 탐색 - 제외 디렉토리는 내려가기 전에 가지치기
+
+    ignore가 주어지면 (.gitignore PathSpec) 매칭되는 디렉토리/파일도 건너뜁니다.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        prefix = '' if current == '.' else current + os.sep
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    path = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in skip:
+                            continue
+                        if ignore is not None and ignore.match_file(path + '/'):
+                            continue
+                        stack.append(path)
+                    elif entry.name.endswith('.py'):
+                        if ignore is not None and ignore.match_file(path):
+                            continue
+                        yield path
+        except OSError:
+            continue
+
+def _count_bytes(path: str, needle: bytes) -> int:
+    """mmap으로 파일 내 바이트 패턴 개수 계산 (디코딩 없음)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return f.read().count(needle)
+        count = 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            while pos != -1:
+                count += 1
+                pos = mm.find(needle, pos + len(needle))
+        return count
+
+def _mmap_contains(path: str, needles: List[bytes]) -> Dict[bytes, bool]:
+    """mmap으로 파일에 각 바이트 패턴이 포함되어 있는지 확인 (str 디코딩 없음)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {needle: False for needle in needles}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return {needle: mm.find(needle) != -1 for needle in needles}
+
+# 검사 결과 레코드 - Python 3.8 호환을 위해 dataclass(slots=True) 대신 __slots__ 직접 선언
+@dataclass
+class CriticalFilesResult:
+    """필수 파일 검사 결과"""
+    __slots__ = ('total', 'existing', 'missing', 'missing_list')
+    total: int
+    existing: int
+    missing: int
+    missing_list: List[Tuple[str, str]]
+
+@dataclass
+class CodeQualityResult:
+    """코드 품질 검사 결과"""
+    __slots__ = ('python_files', 'quality_passed')
+    python_files: int
+    quality_passed: bool
+
+@dataclass
+class DocumentationResult:
+    """문서 품질 검사 결과"""
+    __slots__ = ('readme_exists', 'papers_count', 'quality_passed')
+    readme_exists: bool
+    papers_count: int
+    quality_passed: bool
+
+@dataclass
+class TestsResult:
+    """테스트 완성도 검사 결과 (test_functions_ast는 --strict-tests일 때만 채워짐)"""
+    __slots__ = ('test_files', 'test_functions', 'missing_tests', 'quality_passed', 'test_functions_ast')
+    test_files: int
+    test_functions: int
+    missing_tests: List[str]
+    quality_passed: bool
+    test_functions_ast: Optional[int]
+
+@dataclass
+class DockerResult:
+    """Docker 설정 검사 결과"""
+    __slots__ = ('dockerfile_exists', 'compose_exists', 'quality_passed')
+    dockerfile_exists: bool
+    compose_exists: bool
+    quality_passed: bool
+
+@dataclass
+class GitHubResult:
+    """GitHub 통합 검사 결과"""
+    __slots__ = ('workflows_count', 'has_contributing', 'has_security', 'quality_passed')
+    workflows_count: int
+    has_contributing: bool
+    has_security: bool
+    quality_passed: bool
+
+@dataclass
+class VersionResult:
+    """버전 일관성 검사 결과"""
+    __slots__ = ('version_files', 'consistent', 'target_version')
+    version_files: Dict[str, str]
+    consistent: bool
+    target_version: str
+
+@dataclass
+class SecurityResult:
+    """보안 관행 검사 결과"""
+    __slots__ = ('issues_found', 'has_security_md', 'security_passed')
+    issues_found: int
+    has_security_md: bool
+    security_passed: bool
+
+# 각 검사 항목별 가중치
+_WEIGHTS = {
+    'critical_files': 30,
+    'code_quality': 15,
+    'documentation': 20,
+    'tests': 15,
+    'docker': 10,
+    'github': 5,
+    'version': 3,
+    'security': 2
+}
+_MAX_SCORE = sum(_WEIGHTS.values())
+
+def _score_passed(result, weight: float) -> float:
+    """기본 채점 - 통과 여부에 따라 가중치 전부 또는 0"""
+    passed = (getattr(result, 'quality_passed', False) or getattr(result, 'consistent', False)
+              or getattr(result, 'security_passed', False))
+    return weight if passed else 0
+
+# 항목별 부분 점수 규칙 (없는 항목은 _score_passed 사용)
+_SCORERS = {
+    'critical_files': lambda r, w: w * (r.existing / r.total),
+    'documentation': lambda r, w: w if r.quality_passed and r.papers_count >= 2 else (w * 0.7 if r.quality_passed else 0),
+    'tests': lambda r, w: w if r.quality_passed and r.test_functions >= 10 else (w * 0.8 if r.quality_passed else 0),
+}
+
+class _CheckLog:
+    """검사 1개의 출력/실패/경고/결과 버퍼 (병렬 실행 후 검사 순서대로 병합)"""
+    __slots__ = ('lines', 'failed', 'warnings', 'results', 'elapsed')
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.failed: List[str] = []
+        self.warnings: List[str] = []
+        self.results: Dict[str, Any] = {}
+        self.elapsed = 0.0
 
 class ReleaseReadinessChecker:
     """릴리즈 준비 상태 자동 검사 클래스"""
     
-    def __init__(self):
+    def __init__(self, strict_tests: bool = False):
+        self.strict_tests = strict_tests
         self.project_name = "CBS 1 Gigabit Ethernet Implementation"
         self.version = "2.0.0"
         self.target_repo = "hwkim3330/research_paper"
         self.check_results = {}
         self.failed_checks = []
         self.warnings = []
-        
+        self._file_cache: Dict[str, str] = {}
+        self._bytes_cache: Dict[str, bytes] = {}
+        self._dir_cache: Dict[str, set] = {}
+        self._local = threading.local()
+        self._out: List[str] = []
+        self._py_files: Optional[List[str]] = None
+        self._py_files_lock = threading.Lock()
+        
+    def _current_log(self) -> Optional[_CheckLog]:
+        """현재 스레드에서 실행 중인 검사의 로그 (없으면 None)"""
+        return getattr(self._local, 'log', None)
+
+    def _p(self, *args):
+        """출력 버퍼에 기록 - 병렬 실행 중이면 스레드별 버퍼에 기록"""
+        log = self._current_log()
+        (self._out if log is None else log.lines).append(' '.join(map(str, args)) + '\n')
+
+    def _flush(self):
+        """버퍼된 출력을 write 1회로 내보내기"""
+        if self._out:
+            sys.stdout.write(''.join(self._out))
+            sys.stdout.flush()
+            self._out.clear()
+
+    def _fail(self, message: str):
+        """실패 항목 기록"""
+        log = self._current_log()
+        (self.failed_checks if log is None else log.failed).append(message)
+
+    def _warn(self, message: str):
+        """경고 항목 기록"""
+        log = self._current_log()
+        (self.warnings if log is None else log.warnings).append(message)
+
+    def _record(self, key: str, result: Any):
+        """검사 결과 기록"""
+        log = self._current_log()
+        (self.check_results if log is None else log.results)[key] = result
+
+    def _run_check(self, name: str, check_func) -> _CheckLog:
+        """워커 스레드에서 검사 1개를 실행하고 버퍼된 로그 반환"""
+        log = _CheckLog()
+        self._local.log = log
+        start = time.perf_counter()
+        try:
+            check_func()
+        except Exception as e:
+            log.lines.append(f"❌ {name} 검사 중 오류: {e}\n")
+            log.failed.append(f"{name} check failed: {str(e)}")
+        finally:
+            log.elapsed = time.perf_counter() - start
+            self._local.log = None
+        return log
+
+    def _dir_index(self, directory: str) -> set:
+        """디렉토리 항목 이름 집합 (디렉토리당 1회 listdir)"""
+        entries = self._dir_cache.get(directory)
+        if entries is None:
+            try:
+                entries = set(os.listdir(directory))
+            except OSError:
+                entries = set()
+            self._dir_cache[directory] = entries
+        return entries
+
+    def _exists(self, path) -> bool:
+        """경로 존재 여부 (부모 디렉토리 listdir 캐시 사용 - 실행 중 중복 stat 없음)"""
+        parent, name = os.path.split(os.path.normpath(str(path)))
+        return name in self._dir_index(parent or '.')
+
+    def _all_py_files(self) -> List[str]:
+        """프로젝트 전체 .py 파일 목록 (1회 탐색 후 모든 검사가 공유)"""
+        with self._py_files_lock:
+            if self._py_files is None:
+                self._py_files = list(_iter_py_files('.', ignore=_load_gitignore()))
+            return self._py_files
+
+    def _read_bytes(self, path) -> bytes:
+        """파일 원본 바이트 읽기 (실행 중 파일당 1회만 디스크에서 읽음)"""
+        key = str(path)
+        data = self._bytes_cache.get(key)
+        if data is None:
+            data = Path(path).read_bytes()
+            self._bytes_cache[key] = data
+        return data
+
+    def _read_text(self, path) -> str:
+        """파일 내용 읽기 (캐시된 바이트를 1회만 디코딩)"""
+        key = str(path)
+        content = self._file_cache.get(key)
+        if content is None:
+            content = self._read_bytes(path).decode('utf-8', errors='ignore')
+            self._file_cache[key] = content
+        return content
+
     def print_header(self):
         """헤더 출력"""
-        print("\n" + "="*80)
-        print("🚀 CBS 1 Gigabit Ethernet - 릴리즈 준비 상태 검사")
-        print(f"   Project: {self.project_name}")
-        print(f"   Version: {self.version}")
-        print(f"   Target: github.com/{self.target_repo}")
-        print(f"   Check Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*80)
+        self._p("\n" + "="*80)
+        self._p("🚀 CBS 1 Gigabit Ethernet - 릴리즈 준비 상태 검사")
+        self._p(f"   Project: {self.project_name}")
+        self._p(f"   Version: {self.version}")
+        self._p(f"   Target: github.com/{self.target_repo}")
+        self._p(f"   Check Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._p("="*80)
+        self._flush()
 
     def check_critical_files(self) -> bool:
         """필수 파일들 존재 확인"""
-        print("\n📋 필수 파일 검사...")
-        print("-" * 50)
+        self._p("\n📋 필수 파일 검사...")
+        self._p("-" * 50)
         
         critical_files = [
             # 프로젝트 핵심
@@ -74,276 +418,278 @@ class ReleaseReadinessChecker:
         existing_files = []
         
         for file_path, description in critical_files:
-            if Path(file_path).exists():
-                print(f"✅ {description:<25} ({file_path})")
+            if self._exists(file_path):
+                self._p(f"✅ {description:<25} ({file_path})")
                 existing_files.append((file_path, description))
             else:
-                print(f"❌ {description:<25} ({file_path}) - MISSING")
+                self._p(f"❌ {description:<25} ({file_path}) - MISSING")
                 missing_files.append((file_path, description))
-                self.failed_checks.append(f"Missing critical file: {file_path}")
+                self._fail(f"Missing critical file: {file_path}")
         
-        self.check_results['critical_files'] = {
-            'total': len(critical_files),
-            'existing': len(existing_files),
-            'missing': len(missing_files),
-            'missing_list': missing_files
-        }
+        self._record('critical_files', CriticalFilesResult(
+            total=len(critical_files),
+            existing=len(existing_files),
+            missing=len(missing_files),
+            missing_list=missing_files
+        ))
         
         success = len(missing_files) == 0
-        print(f"\n필수 파일 완성도: {len(existing_files)}/{len(critical_files)}")
+        self._p(f"\n필수 파일 완성도: {len(existing_files)}/{len(critical_files)}")
         return success
 
     def check_code_quality(self) -> bool:
         """코드 품질 검사"""
-        print("\n🔧 코드 품질 검사...")
-        print("-" * 50)
+        self._p("\n🔧 코드 품질 검사...")
+        self._p("-" * 50)
         
         quality_passed = True
         
         # Python 파일 찾기
-        python_files = list(Path('src').glob('*.py')) if Path('src').exists() else []
+        python_files = [f for f in self._all_py_files() if os.path.dirname(f) == 'src']
         
         if len(python_files) == 0:
-            print("❌ src/ 디렉토리에 Python 파일이 없습니다")
-            self.failed_checks.append("No Python files in src/")
+            self._p("❌ src/ 디렉토리에 Python 파일이 없습니다")
+            self._fail("No Python files in src/")
             return False
         
-        print(f"Python 파일 수: {len(python_files)}")
+        self._p(f"Python 파일 수: {len(python_files)}")
         
         # 각 파일의 기본 품질 검사
         for py_file in python_files:
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                data = self._read_bytes(py_file)
                     
-                # 기본 품질 검사
-                has_docstring = '"""' in content or "'''" in content
-                has_imports = 'import ' in content
-                has_functions = 'def ' in content
-                has_classes = 'class ' in content
+                # 기본 품질 검사 (바이트 단위 검색, 디코딩 없음)
+                has_docstring = b'"""' in data or b"'''" in data
+                has_imports = b'import ' in data
+                has_functions = b'def ' in data
+                has_classes = b'class ' in data
+                line_count = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
                 
                 if not has_docstring:
-                    self.warnings.append(f"{py_file.name}: No docstrings found")
+                    self._warn(f"{os.path.basename(py_file)}: No docstrings found")
                 
                 if not (has_functions or has_classes):
-                    self.warnings.append(f"{py_file.name}: No functions or classes found")
+                    self._warn(f"{os.path.basename(py_file)}: No functions or classes found")
                 
-                print(f"  {py_file.name}: {len(content.splitlines())} 라인")
+                self._p(f"  {os.path.basename(py_file)}: {line_count} 라인")
                 
             except Exception as e:
-                print(f"❌ {py_file} 읽기 실패: {e}")
+                self._p(f"❌ {py_file} 읽기 실패: {e}")
                 quality_passed = False
         
-        self.check_results['code_quality'] = {
-            'python_files': len(python_files),
-            'quality_passed': quality_passed
-        }
+        self._record('code_quality', CodeQualityResult(
+            python_files=len(python_files),
+            quality_passed=quality_passed
+        ))
         
         return quality_passed
 
     def check_documentation_quality(self) -> bool:
         """문서 품질 검사"""
-        print("\n📚 문서 품질 검사...")
-        print("-" * 50)
+        self._p("\n📚 문서 품질 검사...")
+        self._p("-" * 50)
         
         doc_quality = True
         
         # README.md 상세 검사
         readme_path = Path('README.md')
-        if readme_path.exists():
-            with open(readme_path, 'r', encoding='utf-8') as f:
-                readme_content = f.read()
+        if self._exists(readme_path):
+            readme_content = self._read_text(readme_path)
             
-            required_sections = [
-                ('# ', '제목'),
-                ('## ', '섹션 헤더'),
-                ('install', '설치 가이드'),
-                ('usage', '사용법'),
-                ('example', '예제')
-            ]
+            found = _match_patterns(readme_content.lower(), _README_SECTIONS, _README_AUTOMATON)
             
             readme_score = 0
-            for pattern, description in required_sections:
-                if pattern.lower() in readme_content.lower():
-                    print(f"✅ README: {description} 포함")
+            for index, (_, description) in enumerate(_README_SECTIONS):
+                if index in found:
+                    self._p(f"✅ README: {description} 포함")
                     readme_score += 1
                 else:
-                    print(f"⚠️ README: {description} 누락")
-                    self.warnings.append(f"README missing: {description}")
+                    self._p(f"⚠️ README: {description} 누락")
+                    self._warn(f"README missing: {description}")
             
-            print(f"README 품질: {readme_score}/{len(required_sections)}")
+            self._p(f"README 품질: {readme_score}/{len(_README_SECTIONS)}")
             
             # README 길이 검사
             if len(readme_content) < 1000:
-                self.warnings.append("README too short (< 1000 characters)")
+                self._warn("README too short (< 1000 characters)")
             
         else:
-            print("❌ README.md 파일이 없습니다")
-            self.failed_checks.append("Missing README.md")
+            self._p("❌ README.md 파일이 없습니다")
+            self._fail("Missing README.md")
             doc_quality = False
         
         # 논문 PDF 검사
         papers = ['paper_korean_perfect.pdf', 'paper_english_final.pdf']
         for paper in papers:
-            paper_path = Path(paper)
-            if paper_path.exists():
-                size_mb = paper_path.stat().st_size / 1024 / 1024
-                print(f"✅ {paper}: {size_mb:.1f} MB")
-                if size_mb < 0.5:
-                    self.warnings.append(f"{paper} seems too small ({size_mb:.1f} MB)")
+            if self._exists(paper):
+                size = os.path.getsize(paper)
+                size_mb = size / _MB
+                self._p(f"✅ {paper}: {size_mb:.1f} MB")
+                if size < _MB // 2:
+                    self._warn(f"{paper} seems too small ({size_mb:.1f} MB)")
             else:
-                print(f"❌ {paper}: 누락")
-                self.failed_checks.append(f"Missing paper: {paper}")
+                self._p(f"❌ {paper}: 누락")
+                self._fail(f"Missing paper: {paper}")
                 doc_quality = False
         
-        self.check_results['documentation'] = {
-            'readme_exists': readme_path.exists(),
-            'papers_count': len([p for p in papers if Path(p).exists()]),
-            'quality_passed': doc_quality
-        }
+        self._record('documentation', DocumentationResult(
+            readme_exists=self._exists(readme_path),
+            papers_count=len([p for p in papers if self._exists(p)]),
+            quality_passed=doc_quality
+        ))
         
         return doc_quality
 
     def check_test_completeness(self) -> bool:
         """테스트 완성도 검사"""
-        print("\n🧪 테스트 완성도 검사...")
-        print("-" * 50)
+        self._p("\n🧪 테스트 완성도 검사...")
+        self._p("-" * 50)
         
         test_quality = True
         
         # 테스트 디렉토리 확인
-        test_dir = Path('tests')
-        if not test_dir.exists():
-            print("❌ tests/ 디렉토리가 없습니다")
-            self.failed_checks.append("Missing tests/ directory")
+        test_dir = 'tests'
+        if not os.path.isdir(test_dir):
+            self._p("❌ tests/ 디렉토리가 없습니다")
+            self._fail("Missing tests/ directory")
             return False
         
         # 테스트 파일들 확인
-        test_files = list(test_dir.glob('test_*.py'))
-        print(f"테스트 파일: {len(test_files)}개")
+        with os.scandir(test_dir) as it:
+            test_files = [
+                entry for entry in it
+                if entry.name.startswith('test_') and entry.name.endswith('.py') and entry.is_file()
+            ]
+        self._p(f"테스트 파일: {len(test_files)}개")
         
         if len(test_files) == 0:
-            print("❌ 테스트 파일이 없습니다")
-            self.failed_checks.append("No test files found")
+            self._p("❌ 테스트 파일이 없습니다")
+            self._fail("No test files found")
             return False
         
         # 각 핵심 모듈에 대응하는 테스트 확인
         core_modules = ['cbs_calculator', 'network_simulator', 'ml_optimizer']
         missing_tests = []
+        test_names = {entry.name for entry in test_files}
         
         for module in core_modules:
-            test_file = test_dir / f'test_{module}.py'
-            if test_file.exists():
-                print(f"✅ {module} 테스트 존재")
+            if f'test_{module}.py' in test_names:
+                self._p(f"✅ {module} 테스트 존재")
             else:
-                print(f"⚠️ {module} 테스트 누락")
+                self._p(f"⚠️ {module} 테스트 누락")
                 missing_tests.append(module)
-                self.warnings.append(f"Missing test for {module}")
+                self._warn(f"Missing test for {module}")
         
-        # 테스트 함수 수 계산
+        # 테스트 함수 수 계산 (기본: 바이트 카운트, --strict-tests: AST 파싱)
         total_test_functions = 0
+        total_ast_functions = 0
         for test_file in test_files:
             try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    test_count = content.count('def test_')
-                    total_test_functions += test_count
-                    print(f"  {test_file.name}: {test_count} 테스트")
+                test_count = _count_bytes(test_file.path, b'def test_')
+                total_test_functions += test_count
+                if self.strict_tests:
+                    tree = ast.parse(self._read_bytes(test_file.path), filename=test_file.path)
+                    ast_count = sum(
+                        1 for node in ast.walk(tree)
+                        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        and node.name.startswith('test_')
+                    )
+                    total_ast_functions += ast_count
+                    self._p(f"  {test_file.name}: {test_count} 테스트 (AST: {ast_count})")
+                else:
+                    self._p(f"  {test_file.name}: {test_count} 테스트")
             except Exception as e:
-                print(f"❌ {test_file} 읽기 실패: {e}")
+                self._p(f"❌ {test_file.path} 읽기 실패: {e}")
                 test_quality = False
         
-        print(f"총 테스트 함수: {total_test_functions}")
+        self._p(f"총 테스트 함수: {total_test_functions}")
+        if self.strict_tests:
+            self._p(f"총 테스트 함수 (AST): {total_ast_functions}")
         
         if total_test_functions < 10:
-            self.warnings.append(f"Low test count: {total_test_functions} (recommended: 10+)")
+            self._warn(f"Low test count: {total_test_functions} (recommended: 10+)")
         
-        self.check_results['tests'] = {
-            'test_files': len(test_files),
-            'test_functions': total_test_functions,
-            'missing_tests': missing_tests,
-            'quality_passed': test_quality
-        }
+        self._record('tests', TestsResult(
+            test_files=len(test_files),
+            test_functions=total_test_functions,
+            missing_tests=missing_tests,
+            quality_passed=test_quality,
+            test_functions_ast=total_ast_functions if self.strict_tests else None
+        ))
         
         return test_quality
 
     def check_docker_configuration(self) -> bool:
         """Docker 설정 검사"""
-        print("\n🐳 Docker 설정 검사...")
-        print("-" * 50)
+        self._p("\n🐳 Docker 설정 검사...")
+        self._p("-" * 50)
         
         docker_quality = True
         
         # Dockerfile 검사
         dockerfile_path = Path('Dockerfile')
-        if dockerfile_path.exists():
-            with open(dockerfile_path, 'r', encoding='utf-8') as f:
-                dockerfile_content = f.read()
-            
-            required_elements = [
-                ('FROM', '베이스 이미지'),
-                ('COPY', '파일 복사'),
-                ('RUN', '명령 실행'),
-                ('EXPOSE', '포트 노출'),
-                ('CMD', '실행 명령')
-            ]
+        if self._exists(dockerfile_path):
+            found = _mmap_contains(str(dockerfile_path), [element for element, _ in _DOCKERFILE_ELEMENTS])
             
-            for element, description in required_elements:
-                if element in dockerfile_content:
-                    print(f"✅ Dockerfile: {description} 포함")
+            for element, description in _DOCKERFILE_ELEMENTS:
+                if found[element]:
+                    self._p(f"✅ Dockerfile: {description} 포함")
                 else:
-                    print(f"⚠️ Dockerfile: {description} 누락")
-                    self.warnings.append(f"Dockerfile missing: {description}")
+                    self._p(f"⚠️ Dockerfile: {description} 누락")
+                    self._warn(f"Dockerfile missing: {description}")
         else:
-            print("❌ Dockerfile이 없습니다")
-            self.failed_checks.append("Missing Dockerfile")
+            self._p("❌ Dockerfile이 없습니다")
+            self._fail("Missing Dockerfile")
             docker_quality = False
         
         # docker-compose.yml 검사
         compose_path = Path('docker-compose.yml')
-        if compose_path.exists():
-            with open(compose_path, 'r', encoding='utf-8') as f:
-                compose_content = f.read()
-            
-            services_count = compose_content.count('build:') + compose_content.count('image:')
-            print(f"✅ docker-compose.yml: ~{services_count} 서비스")
+        if self._exists(compose_path):
+            services_count = (_count_bytes(str(compose_path), b'build:') +
+                              _count_bytes(str(compose_path), b'image:'))
+            self._p(f"✅ docker-compose.yml: ~{services_count} 서비스")
             
             if services_count < 2:
-                self.warnings.append("docker-compose has few services")
+                self._warn("docker-compose has few services")
         else:
-            print("❌ docker-compose.yml이 없습니다")
-            self.failed_checks.append("Missing docker-compose.yml")
+            self._p("❌ docker-compose.yml이 없습니다")
+            self._fail("Missing docker-compose.yml")
             docker_quality = False
         
-        self.check_results['docker'] = {
-            'dockerfile_exists': dockerfile_path.exists(),
-            'compose_exists': compose_path.exists(),
-            'quality_passed': docker_quality
-        }
+        self._record('docker', DockerResult(
+            dockerfile_exists=self._exists(dockerfile_path),
+            compose_exists=self._exists(compose_path),
+            quality_passed=docker_quality
+        ))
         
         return docker_quality
 
     def check_github_integration(self) -> bool:
         """GitHub 통합 검사"""
-        print("\n⚙️ GitHub 통합 검사...")
-        print("-" * 50)
+        self._p("\n⚙️ GitHub 통합 검사...")
+        self._p("-" * 50)
         
         github_quality = True
         
         # GitHub Actions 워크플로우 검사
-        workflows_dir = Path('.github/workflows')
-        if workflows_dir.exists():
-            workflow_files = list(workflows_dir.glob('*.yml'))
-            print(f"GitHub Actions 워크플로우: {len(workflow_files)}개")
+        workflows_dir = '.github/workflows'
+        workflows_count = 0
+        if self._exists(workflows_dir):
+            # Path 객체 없이 이름만 수집 (개수는 출력 전에 필요)
+            with os.scandir(workflows_dir) as it:
+                workflow_names = [entry.name for entry in it if entry.name.endswith('.yml')]
+            workflows_count = len(workflow_names)
+            self._p(f"GitHub Actions 워크플로우: {workflows_count}개")
             
-            for workflow in workflow_files:
-                print(f"  ✅ {workflow.name}")
+            for name in workflow_names:
+                self._p(f"  ✅ {name}")
                 
-            if len(workflow_files) == 0:
-                self.warnings.append("No GitHub Actions workflows found")
+            if workflows_count == 0:
+                self._warn("No GitHub Actions workflows found")
         else:
-            print("⚠️ .github/workflows 디렉토리가 없습니다")
-            self.warnings.append("Missing GitHub Actions workflows")
+            self._p("⚠️ .github/workflows 디렉토리가 없습니다")
+            self._warn("Missing GitHub Actions workflows")
         
         # 기타 GitHub 파일들
         github_files = [
@@ -354,175 +700,128 @@ class ReleaseReadinessChecker:
         ]
         
         for file_path, description in github_files:
-            if Path(file_path).exists():
-                print(f"✅ {description}")
+            if self._exists(file_path):
+                self._p(f"✅ {description}")
             else:
-                print(f"⚠️ {description} 누락")
-                self.warnings.append(f"Missing {description}")
-        
-        self.check_results['github'] = {
-            'workflows_count': len(workflow_files) if workflows_dir.exists() else 0,
-            'has_contributing': Path('CONTRIBUTING.md').exists(),
-            'has_security': Path('SECURITY.md').exists(),
-            'quality_passed': github_quality
-        }
+                self._p(f"⚠️ {description} 누락")
+                self._warn(f"Missing {description}")
+        
+        self._record('github', GitHubResult(
+            workflows_count=workflows_count,
+            has_contributing=self._exists('CONTRIBUTING.md'),
+            has_security=self._exists('SECURITY.md'),
+            quality_passed=github_quality
+        ))
         
         return github_quality
 
     def check_version_consistency(self) -> bool:
         """버전 일관성 검사"""
-        print("\n🔢 버전 일관성 검사...")
-        print("-" * 50)
+        self._p("\n🔢 버전 일관성 검사...")
+        self._p("-" * 50)
         
         version_files = {}
         version_consistent = True
         
         # pyproject.toml 버전
         pyproject_path = Path('pyproject.toml')
-        if pyproject_path.exists():
-            with open(pyproject_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # version = "2.0.0" 패턴 찾기
-                import re
-                version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if version_match:
-                    version_files['pyproject.toml'] = version_match.group(1)
+        if self._exists(pyproject_path):
+            content = self._read_text(pyproject_path)
+            version = None
+            if tomllib is not None:
+                try:
+                    version = tomllib.loads(content).get('project', {}).get('version')
+                except tomllib.TOMLDecodeError:
+                    version = None
+            if version is None:
+                version_match = _VERSION_RE.search(content)
+                version = version_match.group(1) if version_match else None
+            if version:
+                version_files['pyproject.toml'] = version
         
         # setup.py 버전 (있는 경우)
         setup_path = Path('setup.py')
-        if setup_path.exists():
-            with open(setup_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if version_match:
-                    version_files['setup.py'] = version_match.group(1)
+        if self._exists(setup_path):
+            content = self._read_text(setup_path)
+            version_match = _VERSION_RE.search(content)
+            if version_match:
+                version_files['setup.py'] = version_match.group(1)
         
         # 버전 일관성 확인
         if len(version_files) > 1:
             versions = list(version_files.values())
             if len(set(versions)) == 1:
-                print(f"✅ 모든 파일에서 버전 일치: {versions[0]}")
+                self._p(f"✅ 모든 파일에서 버전 일치: {versions[0]}")
             else:
-                print("❌ 버전 불일치 발견:")
+                self._p("❌ 버전 불일치 발견:")
                 for file, version in version_files.items():
-                    print(f"  {file}: {version}")
-                self.failed_checks.append("Version inconsistency")
+                    self._p(f"  {file}: {version}")
+                self._fail("Version inconsistency")
                 version_consistent = False
         else:
-            print("⚠️ 버전 정보를 찾을 수 없습니다")
-            self.warnings.append("No version information found")
+            self._p("⚠️ 버전 정보를 찾을 수 없습니다")
+            self._warn("No version information found")
         
-        self.check_results['version'] = {
-            'version_files': version_files,
-            'consistent': version_consistent,
-            'target_version': self.version
-        }
+        self._record('version', VersionResult(
+            version_files=version_files,
+            consistent=version_consistent,
+            target_version=self.version
+        ))
         
         return version_consistent
 
     def check_security_practices(self) -> bool:
         """보안 관행 검사"""
-        print("\n🔒 보안 관행 검사...")
-        print("-" * 50)
+        self._p("\n🔒 보안 관행 검사...")
+        self._p("-" * 50)
         
         security_ok = True
         
-        # 민감한 정보 검사 패턴들
-        sensitive_patterns = [
-            (r'password\s*=\s*["\'][^"\']*["\']', '하드코딩된 패스워드'),
-            (r'api_key\s*=\s*["\'][^"\']*["\']', 'API 키'),
-            (r'secret\s*=\s*["\'][^"\']*["\']', '시크릿 키'),
-            (r'token\s*=\s*["\'][^"\']*["\']', '토큰'),
-            (r'["\'][A-Za-z0-9+/]{20,}={0,2}["\']', 'Base64 인코딩된 시크릿')
-        ]
-        
         # Python 파일들에서 민감한 정보 검사
-        python_files = list(Path('.').rglob('*.py'))
-        python_files = [f for f in python_files if 'venv' not in str(f) and '__pycache__' not in str(f)]
-        
         security_issues = []
         
-        for py_file in python_files:
+        for py_file in self._all_py_files():
             try:
-                with open(py_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                for pattern, description in sensitive_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        security_issues.append(f"{py_file}: {description}")
+                content = self._read_text(py_file)
+                for description in _find_sensitive(content):
+                    security_issues.append(f"{py_file}: {description}")
                         
             except Exception as e:
                 continue
         
         if security_issues:
-            print("❌ 보안 이슈 발견:")
+            self._p("❌ 보안 이슈 발견:")
+            for issue in security_issues:
+                self._p(f"  {issue}")
             for issue in security_issues:
-                print(f"  {issue}")
-            self.failed_checks.extend(security_issues)
+                self._fail(issue)
             security_ok = False
         else:
-            print("✅ 하드코딩된 시크릿 없음")
+            self._p("✅ 하드코딩된 시크릿 없음")
         
         # SECURITY.md 존재 확인
-        if Path('SECURITY.md').exists():
-            print("✅ 보안 정책 문서 존재")
+        if self._exists('SECURITY.md'):
+            self._p("✅ 보안 정책 문서 존재")
         else:
-            print("⚠️ SECURITY.md 파일 누락")
-            self.warnings.append("Missing SECURITY.md")
+            self._p("⚠️ SECURITY.md 파일 누락")
+            self._warn("Missing SECURITY.md")
         
-        self.check_results['security'] = {
-            'issues_found': len(security_issues),
-            'has_security_md': Path('SECURITY.md').exists(),
-            'security_passed': security_ok
-        }
+        self._record('security', SecurityResult(
+            issues_found=len(security_issues),
+            has_security_md=self._exists('SECURITY.md'),
+            security_passed=security_ok
+        ))
         
         return security_ok
 
     def calculate_readiness_score(self) -> float:
         """릴리즈 준비 점수 계산"""
-        total_score = 0
-        max_score = 0
-        
-        # 각 검사 항목별 가중치
-        weights = {
-            'critical_files': 30,
-            'code_quality': 15,
-            'documentation': 20,
-            'tests': 15,
-            'docker': 10,
-            'github': 5,
-            'version': 3,
-            'security': 2
-        }
-        
-        for check_name, weight in weights.items():
-            max_score += weight
-            
-            if check_name in self.check_results:
-                result = self.check_results[check_name]
-                
-                if check_name == 'critical_files':
-                    completion = result['existing'] / result['total']
-                    total_score += weight * completion
-                    
-                elif check_name == 'documentation':
-                    if result['quality_passed'] and result['papers_count'] >= 2:
-                        total_score += weight
-                    elif result['quality_passed']:
-                        total_score += weight * 0.7
-                        
-                elif check_name == 'tests':
-                    if result['quality_passed'] and result['test_functions'] >= 10:
-                        total_score += weight
-                    elif result['quality_passed']:
-                        total_score += weight * 0.8
-                        
-                else:
-                    if result.get('quality_passed', False) or result.get('consistent', False) or result.get('security_passed', False):
-                        total_score += weight
-        
-        return (total_score / max_score) * 100 if max_score > 0 else 0
+        total_score = sum(
+            _SCORERS.get(check_name, _score_passed)(self.check_results[check_name], weight)
+            for check_name, weight in _WEIGHTS.items()
+            if check_name in self.check_results
+        )
+        return (total_score / _MAX_SCORE) * 100 if _MAX_SCORE > 0 else 0
 
     def generate_readiness_report(self) -> Dict[str, Any]:
         """릴리즈 준비 리포트 생성"""
@@ -533,7 +832,7 @@ class ReleaseReadinessChecker:
             'project': self.project_name,
             'version': self.version,
             'readiness_score': readiness_score,
-            'check_results': self.check_results,
+            'check_results': {name: asdict(result) for name, result in self.check_results.items()},
             'failed_checks': self.failed_checks,
             'warnings': self.warnings,
             'recommendation': self.get_release_recommendation(readiness_score)
@@ -557,9 +856,9 @@ class ReleaseReadinessChecker:
         score = report['readiness_score']
         recommendation = report['recommendation']
         
-        print("\n" + "="*80)
-        print("🏆 최종 릴리즈 준비 평가")
-        print("="*80)
+        self._p("\n" + "="*80)
+        self._p("🏆 최종 릴리즈 준비 평가")
+        self._p("="*80)
         
         # 점수에 따른 색상/이모지
         if score >= 95:
@@ -571,48 +870,55 @@ class ReleaseReadinessChecker:
         else:
             status_emoji = "❌"
         
-        print(f"\n{status_emoji} 릴리즈 준비 점수: {score:.1f}/100")
-        print(f"📋 권장사항: {recommendation}")
+        self._p(f"\n{status_emoji} 릴리즈 준비 점수: {score:.1f}/100")
+        self._p(f"📋 권장사항: {recommendation}")
         
         # 실패한 검사들
         if self.failed_checks:
-            print(f"\n❌ 해결 필요한 이슈 ({len(self.failed_checks)}개):")
+            self._p(f"\n❌ 해결 필요한 이슈 ({len(self.failed_checks)}개):")
             for i, issue in enumerate(self.failed_checks[:10], 1):  # 최대 10개만 표시
-                print(f"  {i}. {issue}")
+                self._p(f"  {i}. {issue}")
             if len(self.failed_checks) > 10:
-                print(f"  ... 외 {len(self.failed_checks) - 10}개 추가")
+                self._p(f"  ... 외 {len(self.failed_checks) - 10}개 추가")
         
         # 경고사항들
         if self.warnings:
-            print(f"\n⚠️ 권장 개선사항 ({len(self.warnings)}개):")
+            self._p(f"\n⚠️ 권장 개선사항 ({len(self.warnings)}개):")
             for i, warning in enumerate(self.warnings[:5], 1):  # 최대 5개만 표시
-                print(f"  {i}. {warning}")
+                self._p(f"  {i}. {warning}")
             if len(self.warnings) > 5:
-                print(f"  ... 외 {len(self.warnings) - 5}개 추가")
+                self._p(f"  ... 외 {len(self.warnings) - 5}개 추가")
         
         # 다음 단계 안내
-        print(f"\n🚀 다음 단계:")
+        self._p(f"\n🚀 다음 단계:")
         if score >= 95:
-            print("  1. GitHub에 코드 푸시")
-            print("  2. 릴리즈 태그 생성")
-            print("  3. GitHub Release 생성")
-            print("  4. PyPI 배포 (선택)")
+            self._p("  1. GitHub에 코드 푸시")
+            self._p("  2. 릴리즈 태그 생성")
+            self._p("  3. GitHub Release 생성")
+            self._p("  4. PyPI 배포 (선택)")
         elif score >= 85:
-            print("  1. 경고사항 검토 및 개선")
-            print("  2. 릴리즈 준비 재검사")
-            print("  3. GitHub 배포 진행")
+            self._p("  1. 경고사항 검토 및 개선")
+            self._p("  2. 릴리즈 준비 재검사")
+            self._p("  3. GitHub 배포 진행")
         else:
-            print("  1. 실패한 검사 항목 수정")
-            print("  2. 릴리즈 준비 재검사")
-            print("  3. 점수 95+ 달성 후 배포")
+            self._p("  1. 실패한 검사 항목 수정")
+            self._p("  2. 릴리즈 준비 재검사")
+            self._p("  3. 점수 95+ 달성 후 배포")
+        self._flush()
 
     def save_report(self, report: Dict[str, Any]):
         """리포트 파일 저장"""
         report_file = "release_readiness_report.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            Path(report_file).write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+            )
+        else:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
-        print(f"\n💾 상세 리포트 저장: {report_file}")
+        self._p(f"\n💾 상세 리포트 저장: {report_file}")
+        self._flush()
 
     def run_full_check(self) -> bool:
         """전체 검사 실행"""
@@ -630,13 +936,17 @@ class ReleaseReadinessChecker:
             ("보안 관행", self.check_security_practices)
         ]
         
-        for name, check_func in checks:
-            try:
-                check_func()
-                time.sleep(0.3)  # 진행 표시
-            except Exception as e:
-                print(f"❌ {name} 검사 중 오류: {e}")
-                self.failed_checks.append(f"{name} check failed: {str(e)}")
+        # 검사들은 서로 독립적인 파일 I/O이므로 병렬 실행 후 원래 순서대로 병합
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(self._run_check, name, check_func) for name, check_func in checks]
+            for future in futures:
+                log = future.result()
+                self._out.extend(log.lines)
+                self._p(f"⏱️ 소요 시간: {log.elapsed:.2f}s")
+                self._flush()
+                self.failed_checks.extend(log.failed)
+                self.warnings.extend(log.warnings)
+                self.check_results.update(log.results)
         
         # 최종 리포트 생성 및 출력
         report = self.generate_readiness_report()
@@ -647,7 +957,15 @@ class ReleaseReadinessChecker:
 
 def main():
     """메인 실행 함수"""
-    checker = ReleaseReadinessChecker()
+    parser = argparse.ArgumentParser(
+        description='CBS 1 Gigabit Ethernet 릴리즈 준비 상태 검사'
+    )
+    parser.add_argument('--strict-tests', action='store_true',
+                       help='테스트 함수 수를 AST 파싱으로도 계산하여 비교')
+    
+    args = parser.parse_args()
+    
+    checker = ReleaseReadinessChecker(strict_tests=args.strict_tests)
     
     try:
         ready = checker.run_full_check()
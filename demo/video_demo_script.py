@@ -9,20 +9,211 @@ import os
 import sys
 import time
 import json
+import hashlib
+import subprocess
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 from matplotlib.patches import Rectangle, FancyBboxPatch
 from matplotlib.gridspec import GridSpec
-import seaborn as sns
+from matplotlib.collections import PatchCollection, LineCollection
+from cycler import cycler
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from datetime import datetime
 from typing import List, Dict, Tuple
-import subprocess
-import cv2
+from concurrent.futures import ProcessPoolExecutor, Future
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.cbs_calculator import CBSCalculator
-from src.network_simulator import NetworkSimulator, CBSQueue
+from src.network_simulator import NetworkSimulator, _cbs_update_credit
+
+# Text and path settings shared by every figure: no TeX, one concrete
+# monospace face for the stats/config panels, and maximal path simplification
+plt.rcParams.update({
+    'text.usetex': False,
+    'font.monospace': ['DejaVu Sans Mono'],
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+})
+
+# seaborn's default 6-color "husl" palette, so seaborn is not needed at runtime
+_HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# Frame sizes (bytes) drawn uniformly by the credit evolution simulation
+_FRAME_SIZES = np.array([64, 256, 512, 1024, 1500], dtype=np.int32)
+
+# Samples kept on the animated latency/throughput panels (30 s at 10 fps)
+_DISPLAY_WINDOW = 300
+
+# Rendered assets, reused by main() while their inputs are unchanged
+_RENDERED_ASSETS = {
+    'create_credit_evolution_animation': 'cbs_credit_evolution.mp4',
+    'create_comparison_visualization': 'cbs_comparison.png',
+    'create_hardware_demo_visualization': 'hardware_demo.png',
+}
+
+# Stats panel of the credit evolution animation
+_STATS_TEMPLATE = """
+            CBS Performance Statistics
+            ═══════════════════════════
+            Link Speed: %d Mbps
+            Idle Slope: %d Mbps
+            Send Slope: %d Mbps
+            
+            Current Metrics:
+            • Credit: %.1f bits
+            • Queue Length: %d frames
+            • Avg Latency: %.2f ms
+            • Throughput: %.1f Mbps
+            
+            Frame Statistics:
+            • Total Processed: %d
+            • Dropped: 0
+            • Success Rate: 100%%
+            """
+
+
+class FrameRing:
+    """Fixed-capacity FIFO of frames stored as parallel size/arrival-time arrays"""
+    
+    __slots__ = ('sizes', 'arrival_times', 'head', 'count', 'arrival_sum')
+    
+    def __init__(self, capacity: int):
+        self.sizes = np.empty(capacity)
+        self.arrival_times = np.empty(capacity)
+        self.head = 0
+        self.count = 0
+        self.arrival_sum = 0.0  # Running sum keeps the mean latency O(1)
+        
+    def __len__(self) -> int:
+        return self.count
+        
+    def add_frame(self, size: float, arrival_time: float) -> None:
+        capacity = len(self.sizes)
+        if self.count == capacity:
+            raise OverflowError("frame ring is full")
+        tail = (self.head + self.count) % capacity
+        self.sizes[tail] = size
+        self.arrival_times[tail] = arrival_time
+        self.count += 1
+        self.arrival_sum += arrival_time
+        
+    def remove_frame(self) -> Tuple[float, float]:
+        if not self.count:
+            raise IndexError("remove from empty frame ring")
+        head = self.head
+        self.head = (head + 1) % len(self.sizes)
+        self.count -= 1
+        self.arrival_sum -= self.arrival_times[head]
+        return self.sizes[head], self.arrival_times[head]
+        
+    def head_sizes(self, k: int) -> np.ndarray:
+        """Sizes of the first k queued frames, oldest first"""
+        k = min(k, self.count)
+        return self.sizes.take(range(self.head, self.head + k), mode='wrap')
+        
+    def mean_latency(self, current_time: float) -> float:
+        return current_time - self.arrival_sum / self.count if self.count else 0.0
+
+
+def simulate_credit_evolution(n_frames: int, idle_slope: float, send_slope: float,
+                              hi_credit: float, lo_credit: float, n_slots: int = 10,
+                              rng: np.random.Generator = None) -> Dict[str, np.ndarray]:
+    """Simulate a single CBS queue sampled every 100 ms, independent of any figure
+    
+    Returns per-sample time, credit, queue length, average latency (ms),
+    throughput (Mbps) and the normalized sizes of the first n_slots queued
+    frames (NaN where the slot is empty).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Traffic pattern is drawn up front: one arrival decision and one
+    # frame size per sample
+    arrivals = rng.random(n_frames) < 0.3  # 30% chance of frame arrival
+    sizes = _FRAME_SIZES[rng.integers(0, len(_FRAME_SIZES), size=n_frames)]
+    
+    time_points = np.arange(n_frames) * 0.1
+    credit_values = np.empty(n_frames)
+    queue_lengths = np.empty(n_frames, dtype=np.int32)
+    latencies = np.empty(n_frames)
+    throughput_values = np.empty(n_frames)
+    queue_heights = np.full((n_frames, n_slots), np.nan)
+    
+    queue = FrameRing(n_frames)
+    credit = 0.0
+    last_update_time = 0.0
+    window_sum = 0
+    
+    # Hot loop: bind methods once and iterate over plain Python scalars
+    add_frame = queue.add_frame
+    mean_latency = queue.mean_latency
+    head_sizes = queue.head_sizes
+    update_credit = _cbs_update_credit
+    for i, (current_time, arrived, size) in enumerate(
+            zip(time_points.tolist(), arrivals.tolist(), sizes.tolist())):
+        if arrived:
+            add_frame(size, current_time)
+        
+        # Credit drains while frames are queued and resets when empty
+        queued = queue.count
+        if queued:
+            credit = update_credit(credit, idle_slope, send_slope, hi_credit,
+                                   lo_credit, current_time - last_update_time, True)
+        else:
+            credit = 0.0
+        last_update_time = current_time
+        
+        credit_values[i] = credit
+        queue_lengths[i] = queued
+        latencies[i] = mean_latency(current_time) * 1000  # Convert to ms
+        
+        # 10-sample sliding window, updated incrementally
+        window_sum += queued
+        if i >= 10:
+            window_sum -= queue_lengths[i - 10]
+            throughput_values[i] = window_sum * 1500 * 8 / 1000  # Mbps
+        else:
+            throughput_values[i] = 0
+        
+        if queued:
+            heights = head_sizes(n_slots) / 1500
+            queue_heights[i, :len(heights)] = heights
+    
+    return {
+        'time': time_points,
+        'credit': credit_values,
+        'queue_length': queue_lengths,
+        'latency': latencies,
+        'throughput': throughput_values,
+        'queue_heights': queue_heights,
+    }
+
+
+def completed_transmissions(events: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Event positions, timestamps and latencies (ms) of completed transmissions
+    
+    The event list is scanned once into parallel arrays and filtered with a mask.
+    """
+    n = len(events)
+    types = np.fromiter((e['type'] for e in events), dtype='U24', count=n)
+    timestamps = np.fromiter((e.get('timestamp', np.nan) for e in events),
+                             dtype=np.float64, count=n)
+    latencies = np.fromiter((e.get('latency', np.nan) for e in events),
+                            dtype=np.float64, count=n)
+    mask = types == 'transmission_complete'
+    return np.flatnonzero(mask), timestamps[mask], latencies[mask] * 1000
+
+
+def run_comparison_scenario(queue_params: Dict, sim_duration: float) -> Dict:
+    """Run the mixed CBR + Poisson comparison workload on a single queue"""
+    sim = NetworkSimulator(link_speed_mbps=1000)
+    sim.add_cbs_queue(0, **queue_params)
+    sim.generate_traffic('cbr', duration=sim_duration, rate_mbps=200, 
+                         frame_size=1024, queue_id=0)
+    sim.generate_traffic('poisson', duration=sim_duration, rate_mbps=100, 
+                         mean_size=512, queue_id=0)
+    return sim.run(sim_duration)
+
 
 class CBSDemoVisualizer:
     """Creates animated visualizations for CBS algorithm demonstration"""
@@ -31,9 +222,7 @@ class CBSDemoVisualizer:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set style
-        plt.style.use('seaborn-v0_8-darkgrid')
-        sns.set_palette("husl")
+        self._apply_style()
         
         # CBS parameters for 1 Gbps
         self.link_speed = 1000  # Mbps
@@ -48,10 +237,15 @@ class CBSDemoVisualizer:
             'transmission': '#6A994E'
         }
         
-    def create_credit_evolution_animation(self, duration: int = 30):
-        """Create animation showing credit evolution over time"""
-        print("[Demo] Creating credit evolution animation...")
+    def _apply_style(self):
+        """Set the shared plot style (per process, since rcParams are not pickled)"""
+        plt.style.use('seaborn-v0_8-darkgrid')
+        plt.rcParams['axes.prop_cycle'] = cycler(color=_HUSL_PALETTE)
         
+    def _setup_axes(self, duration: int, hi_credit: float, lo_credit: float,
+                    latency_max: float, throughput_max: float) -> Dict:
+        """Build the credit animation figure once: static cosmetics plus the
+        persistent artists that the per-frame update mutates"""
         fig = plt.figure(figsize=(16, 10))
         gs = GridSpec(3, 2, figure=fig, hspace=0.3, wspace=0.3)
         
@@ -62,150 +256,212 @@ class CBSDemoVisualizer:
         ax_throughput = fig.add_subplot(gs[2, 0])
         ax_stats = fig.add_subplot(gs[2, 1])
         
-        # Initialize CBS queue
-        cbs_queue = CBSQueue(
-            queue_id=0,
-            idle_slope=750,  # 75% for AVB
-            send_slope=-250,  # 25% reduction
-            hi_credit=2000,
-            lo_credit=-1000
-        )
-        
-        # Time series data
-        time_points = []
-        credit_values = []
-        queue_lengths = []
-        latencies = []
-        throughput_values = []
-        
-        # Animation update function
-        def update(frame):
-            current_time = frame * 0.1
-            time_points.append(current_time)
-            
-            # Simulate frame arrivals
-            if np.random.random() < 0.3:  # 30% chance of frame arrival
-                frame_size = np.random.choice([64, 256, 512, 1024, 1500])
-                cbs_queue.add_frame({
-                    'size': frame_size,
-                    'arrival_time': current_time,
-                    'priority': 'AVB_A'
-                })
-            
-            # Update credit
-            cbs_queue.update_credit(current_time, len(cbs_queue.frames) > 0)
-            
-            # Record metrics
-            credit_values.append(cbs_queue.credit)
-            queue_lengths.append(len(cbs_queue.frames))
-            
-            # Calculate latency
-            if cbs_queue.frames:
-                avg_latency = np.mean([current_time - f['arrival_time'] 
-                                       for f in cbs_queue.frames])
-                latencies.append(avg_latency * 1000)  # Convert to ms
-            else:
-                latencies.append(0)
-            
-            # Calculate throughput
-            if len(time_points) > 10:
-                recent_throughput = sum(queue_lengths[-10:]) * 1500 * 8 / 1000  # Mbps
-                throughput_values.append(recent_throughput)
-            else:
-                throughput_values.append(0)
-            
-            # Clear and redraw
-            ax_credit.clear()
-            ax_queue.clear()
-            ax_latency.clear()
-            ax_throughput.clear()
-            ax_stats.clear()
+        # Limits are fixed so frames never trigger a rescale
+        ax_credit.set_xlim(0, duration)
+        ax_credit.set_ylim(lo_credit * 1.2, hi_credit * 1.2)
+        ax_credit.axhline(y=hi_credit, color='g', 
+                         linestyle='--', alpha=0.5, label='HiCredit')
+        ax_credit.axhline(y=lo_credit, color='r', 
+                         linestyle='--', alpha=0.5, label='LoCredit')
+        ax_credit.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax_credit.set_title('CBS Credit Evolution (1 Gbps Link)', fontsize=14, fontweight='bold')
+        ax_credit.set_xlabel('Time (s)')
+        ax_credit.set_ylabel('Credit (bits)')
+        ax_credit.legend(loc='upper right')
+        ax_credit.grid(True, alpha=0.3)
+        
+        ax_queue.set_xlim(-0.5, 10)
+        ax_queue.set_ylim(0, 1.2)
+        ax_queue.set_title('Queue Status', fontsize=12)
+        ax_queue.set_xlabel('Queue Position')
+        ax_queue.set_ylabel('Frame Size (normalized)')
+        
+        # Series are precomputed, so the limits can fit the whole run up front
+        ax_latency.set_xlim(0, duration)
+        ax_latency.set_ylim(0, max(latency_max * 1.1, 1))
+        ax_latency.set_title('Average Latency', fontsize=12)
+        ax_latency.set_xlabel('Time (s)')
+        ax_latency.set_ylabel('Latency (ms)')
+        ax_latency.grid(True, alpha=0.3)
+        
+        ax_throughput.set_xlim(0, duration)
+        ax_throughput.set_title('Throughput', fontsize=12)
+        ax_throughput.set_xlabel('Time (s)')
+        ax_throughput.set_ylabel('Throughput (Mbps)')
+        ax_throughput.set_ylim(0, max(throughput_max * 1.1, 1000))
+        ax_throughput.grid(True, alpha=0.3)
+        
+        ax_stats.axis('off')
+        
+        # Persistent artists, mutated in place every frame
+        credit_line, = ax_credit.plot([], [], color=self.colors['credit'], linewidth=2)
+        credit_fill = ax_credit.fill_between([], [], alpha=0.3, color=self.colors['credit'])
+        latency_line, = ax_latency.plot([], [], color=self.colors['avb_b'], linewidth=2)
+        latency_fill = ax_latency.fill_between([], [], alpha=0.3, color=self.colors['avb_b'])
+        throughput_line, = ax_throughput.plot([], [], color=self.colors['transmission'], linewidth=2)
+        queue_rects = []
+        for i in range(10):  # Show max 10 frames
+            rect = Rectangle((i, 0), 0.8, 0, facecolor=self.colors['avb_a'],
+                             edgecolor='black', linewidth=1, visible=False)
+            ax_queue.add_patch(rect)
+            queue_rects.append(rect)
+        queue_label = ax_queue.text(0.02, 0.95, '', transform=ax_queue.transAxes,
+                                    fontsize=11, verticalalignment='top')
+        stats_artist = ax_stats.text(0.1, 0.5, '', 
+                                     fontsize=10, family='monospace',
+                                     verticalalignment='center',
+                                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+        return {
+            'figure': fig,
+            'credit_line': credit_line,
+            'credit_fill': credit_fill,
+            'latency_line': latency_line,
+            'latency_fill': latency_fill,
+            'throughput_line': throughput_line,
+            'queue_rects': queue_rects,
+            'queue_label': queue_label,
+            'stats_artist': stats_artist,
+        }
+    
+    def create_credit_evolution_animation(self, duration: int = 30):
+        """Create animation showing credit evolution over time"""
+        print("[Demo] Creating credit evolution animation...")
+        
+        # CBS queue parameters
+        idle_slope = 750  # 75% for AVB
+        send_slope = -250  # 25% reduction
+        hi_credit = 2000
+        lo_credit = -1000
+        
+        # Simulation pass - the whole timeline is computed before any drawing
+        n_frames = duration * 10
+        sim = simulate_credit_evolution(n_frames, idle_slope, send_slope,
+                                        hi_credit, lo_credit)
+        time_points = sim['time']
+        credit_values = sim['credit']
+        queue_lengths = sim['queue_length']
+        latencies = sim['latency']
+        throughput_values = sim['throughput']
+        queue_heights = sim['queue_heights']
+        
+        artists = self._setup_axes(duration, hi_credit, lo_credit,
+                                   latencies.max(initial=0), throughput_values.max(initial=0))
+        fig = artists['figure']
+        credit_line, credit_fill = artists['credit_line'], artists['credit_fill']
+        latency_line, latency_fill = artists['latency_line'], artists['latency_fill']
+        throughput_line = artists['throughput_line']
+        queue_rects = artists['queue_rects']
+        queue_label, stats_artist = artists['queue_label'], artists['stats_artist']
+        animated_artists = (credit_line, credit_fill, latency_line, latency_fill,
+                            throughput_line, *queue_rects, queue_label, stats_artist)
+        
+        def fill_updater(fill, x, y):
+            """Return a setter drawing fill_between(x[lo:hi], 0, y[lo:hi]) from one vertex buffer
             
-            # Plot credit evolution
-            ax_credit.plot(time_points, credit_values, 
-                          color=self.colors['credit'], linewidth=2)
-            ax_credit.axhline(y=cbs_queue.hi_credit, color='g', 
-                             linestyle='--', alpha=0.5, label='HiCredit')
-            ax_credit.axhline(y=cbs_queue.lo_credit, color='r', 
-                             linestyle='--', alpha=0.5, label='LoCredit')
-            ax_credit.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-            ax_credit.fill_between(time_points, 0, credit_values, 
-                                  alpha=0.3, color=self.colors['credit'])
-            ax_credit.set_title('CBS Credit Evolution (1 Gbps Link)', fontsize=14, fontweight='bold')
-            ax_credit.set_xlabel('Time (s)')
-            ax_credit.set_ylabel('Credit (bits)')
-            ax_credit.legend(loc='upper right')
-            ax_credit.grid(True, alpha=0.3)
+            Row k + 1 of the buffer holds point k. Each frame borrows the rows just
+            before and after the window for the baseline vertices and passes a
+            view, so no per-frame arrays are built.
+            """
+            verts = np.zeros((len(x) + 2, 2))
+            verts[1:-1, 0] = x
+            verts[1:-1, 1] = y
+            borrowed = ()
             
-            # Plot queue visualization
-            queue_viz_data = []
-            for i, frame in enumerate(cbs_queue.frames[:10]):  # Show max 10 frames
-                rect = Rectangle((i, 0), 0.8, frame['size']/1500, 
-                                facecolor=self.colors['avb_a'], 
-                                edgecolor='black', linewidth=1)
-                ax_queue.add_patch(rect)
-            ax_queue.set_xlim(-0.5, 10)
-            ax_queue.set_ylim(0, 1.2)
-            ax_queue.set_title(f'Queue Status ({len(cbs_queue.frames)} frames)', fontsize=12)
-            ax_queue.set_xlabel('Queue Position')
-            ax_queue.set_ylabel('Frame Size (normalized)')
+            def set_window(lo, hi):
+                nonlocal borrowed
+                for row in borrowed:  # Give borrowed rows their data back
+                    if 1 <= row <= len(x):
+                        verts[row] = x[row - 1], y[row - 1]
+                if hi > lo:
+                    verts[lo] = x[lo], 0.0
+                    verts[hi + 1] = x[hi - 1], 0.0
+                    borrowed = (lo, hi + 1)
+                    fill.set_verts([verts[lo:hi + 2]])
+                else:
+                    borrowed = ()
+                    fill.set_verts([verts[:0]])
+            return set_window
+        
+        set_credit_fill = fill_updater(credit_fill, time_points, credit_values)
+        set_latency_fill = fill_updater(latency_fill, time_points, latencies)
+        
+        def init():
+            credit_line.set_data([], [])
+            latency_line.set_data([], [])
+            throughput_line.set_data([], [])
+            set_credit_fill(0, 0)
+            set_latency_fill(0, 0)
+            for rect in queue_rects:
+                rect.set_visible(False)
+            queue_label.set_text('')
+            stats_artist.set_text('')
+            return animated_artists
+        
+        # Rendering pass - update() only pushes precomputed values into artists
+        link_speed = self.link_speed
+        
+        def update(frame):
+            n = frame + 1
+            lo = max(0, n - _DISPLAY_WINDOW)  # Latency/throughput show the latest samples only
+            queued = queue_lengths[frame]
             
-            # Plot latency
-            if latencies:
-                ax_latency.plot(time_points, latencies, 
-                              color=self.colors['avb_b'], linewidth=2)
-                ax_latency.fill_between(time_points, 0, latencies, 
-                                       alpha=0.3, color=self.colors['avb_b'])
-            ax_latency.set_title('Average Latency', fontsize=12)
-            ax_latency.set_xlabel('Time (s)')
-            ax_latency.set_ylabel('Latency (ms)')
-            ax_latency.grid(True, alpha=0.3)
+            # Credit evolution
+            credit_line.set_data(time_points[:n], credit_values[:n])
+            set_credit_fill(0, n)
             
-            # Plot throughput
-            if throughput_values:
-                ax_throughput.plot(time_points[len(time_points)-len(throughput_values):], 
-                                 throughput_values, 
-                                 color=self.colors['transmission'], linewidth=2)
-            ax_throughput.set_title('Throughput', fontsize=12)
-            ax_throughput.set_xlabel('Time (s)')
-            ax_throughput.set_ylabel('Throughput (Mbps)')
-            ax_throughput.set_ylim(0, 1000)
-            ax_throughput.grid(True, alpha=0.3)
+            # Queue visualization
+            heights = queue_heights[frame]
+            for i, rect in enumerate(queue_rects):
+                if i < queued:
+                    rect.set_height(heights[i])
+                    rect.set_visible(True)
+                else:
+                    rect.set_visible(False)
+            queue_label.set_text(f'{queued} frames')
             
-            # Display statistics
-            stats_text = f"""
-            CBS Performance Statistics
-            ═══════════════════════════
-            Link Speed: {self.link_speed} Mbps
-            Idle Slope: {cbs_queue.idle_slope} Mbps
-            Send Slope: {cbs_queue.send_slope} Mbps
+            # Latency
+            latency_line.set_data(time_points[lo:n], latencies[lo:n])
+            set_latency_fill(lo, n)
             
-            Current Metrics:
-            • Credit: {cbs_queue.credit:.1f} bits
-            • Queue Length: {len(cbs_queue.frames)} frames
-            • Avg Latency: {latencies[-1] if latencies else 0:.2f} ms
-            • Throughput: {throughput_values[-1] if throughput_values else 0:.1f} Mbps
+            # Throughput
+            throughput_line.set_data(time_points[lo:n], throughput_values[lo:n])
             
-            Frame Statistics:
-            • Total Processed: {frame * 3}
-            • Dropped: 0
-            • Success Rate: 100%
-            """
-            ax_stats.text(0.1, 0.5, stats_text, 
-                         fontsize=10, family='monospace',
-                         verticalalignment='center',
-                         bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-            ax_stats.axis('off')
+            # Display statistics - text layout is refreshed every 5th frame
+            if frame % 5 == 0 or n == n_frames:
+                stats_artist.set_text(_STATS_TEMPLATE % (
+                    link_speed, idle_slope, send_slope, credit_values[frame],
+                    queued, latencies[frame], throughput_values[frame], frame * 3))
             
-            return ax_credit, ax_queue, ax_latency, ax_throughput, ax_stats
+            return animated_artists
         
-        # Create animation
-        anim = animation.FuncAnimation(fig, update, frames=duration*10, 
-                                     interval=100, blit=False)
+        # Render on Agg straight into an ffmpeg pipe: the static background is
+        # drawn once, then each frame restores it and redraws only the animated
+        # artists before handing the raw RGBA buffer to the encoder
+        canvas = FigureCanvasAgg(fig)
+        for artist in animated_artists:
+            artist.set_animated(True)
+        init()
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        height, width = np.asarray(canvas.buffer_rgba()).shape[:2]
         
-        # Save animation
         output_file = os.path.join(self.output_dir, 'cbs_credit_evolution.mp4')
-        anim.save(output_file, writer='ffmpeg', fps=10, bitrate=2000)
+        cmd = [plt.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}',
+               '-r', '10', '-i', '-',
+               '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-b:v', '2000k', output_file]
+        ffmpeg = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        try:
+            for frame in range(n_frames):
+                canvas.restore_region(background)
+                for artist in update(frame):
+                    fig.draw_artist(artist)
+                ffmpeg.stdin.write(canvas.buffer_rgba())
+        finally:
+            ffmpeg.stdin.close()
+            ffmpeg.wait()
+        if ffmpeg.returncode:
+            raise subprocess.CalledProcessError(ffmpeg.returncode, cmd)
         print(f"[Demo] Animation saved to {output_file}")
         
         plt.close()
@@ -222,40 +478,34 @@ class CBSDemoVisualizer:
         # Simulate both scenarios
         sim_duration = 10  # seconds
         
-        # CBS scenario
-        cbs_sim = NetworkSimulator(link_speed_mbps=1000)
-        cbs_sim.add_cbs_queue(0, idle_slope=750, send_slope=-250, 
-                             hi_credit=2000, lo_credit=-1000)
-        cbs_sim.generate_traffic('cbr', duration=sim_duration, rate_mbps=200, 
-                                frame_size=1024, queue_id=0)
-        cbs_sim.generate_traffic('poisson', duration=sim_duration, rate_mbps=100, 
-                                mean_size=512, queue_id=0)
-        cbs_results = cbs_sim.run(sim_duration)
-        
-        # Non-CBS scenario (FIFO)
-        fifo_sim = NetworkSimulator(link_speed_mbps=1000)
-        fifo_sim.add_cbs_queue(0, idle_slope=1000, send_slope=0, 
-                              hi_credit=float('inf'), lo_credit=0)
-        fifo_sim.generate_traffic('cbr', duration=sim_duration, rate_mbps=200, 
-                                 frame_size=1024, queue_id=0)
-        fifo_sim.generate_traffic('poisson', duration=sim_duration, rate_mbps=100, 
-                                 mean_size=512, queue_id=0)
-        fifo_results = fifo_sim.run(sim_duration)
+        # Both scenarios are independent, so they are simulated side by side
+        cbs_queue = dict(idle_slope=750, send_slope=-250, 
+                         hi_credit=2000, lo_credit=-1000)
+        fifo_queue = dict(idle_slope=1000, send_slope=0,  # Non-CBS scenario (FIFO)
+                          hi_credit=float('inf'), lo_credit=0)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            cbs_future = executor.submit(run_comparison_scenario, cbs_queue, sim_duration)
+            fifo_future = executor.submit(run_comparison_scenario, fifo_queue, sim_duration)
+            cbs_results = cbs_future.result()
+            fifo_results = fifo_future.result()
         
         # Extract metrics
-        cbs_latencies = [e['latency']*1000 for e in cbs_results['events'] 
-                        if e['type'] == 'transmission_complete']
-        fifo_latencies = [e['latency']*1000 for e in fifo_results['events'] 
-                         if e['type'] == 'transmission_complete']
+        cbs_index, cbs_times, cbs_latencies = completed_transmissions(cbs_results['events'])
+        fifo_index, fifo_times, fifo_latencies = completed_transmissions(fifo_results['events'])
         
-        cbs_jitter = np.std(cbs_latencies) if cbs_latencies else 0
-        fifo_jitter = np.std(fifo_latencies) if fifo_latencies else 0
+        cbs_jitter = np.std(cbs_latencies) if cbs_latencies.size else 0
+        fifo_jitter = np.std(fifo_latencies) if fifo_latencies.size else 0
         
         # Plot latency distribution
-        axes[0, 0].hist(cbs_latencies, bins=30, alpha=0.7, 
-                       color=self.colors['avb_a'], label='CBS', density=True)
-        axes[0, 0].hist(fifo_latencies, bins=30, alpha=0.7, 
-                       color=self.colors['best_effort'], label='FIFO', density=True)
+        # Binned in NumPy; matplotlib only draws 30 steps per series
+        if cbs_latencies.size:
+            counts, edges = np.histogram(cbs_latencies, bins=30, density=True)
+            axes[0, 0].stairs(counts, edges, fill=True, alpha=0.7, 
+                             color=self.colors['avb_a'], label='CBS')
+        if fifo_latencies.size:
+            counts, edges = np.histogram(fifo_latencies, bins=30, density=True)
+            axes[0, 0].stairs(counts, edges, fill=True, alpha=0.7, 
+                             color=self.colors['best_effort'], label='FIFO')
         axes[0, 0].set_title('Latency Distribution')
         axes[0, 0].set_xlabel('Latency (ms)')
         axes[0, 0].set_ylabel('Probability Density')
@@ -291,21 +541,17 @@ class CBSDemoVisualizer:
         axes[1, 0].set_ylabel('Dropped Frames')
         
         # Plot latency over time
-        cbs_timeline = [(e['timestamp'], e['latency']*1000) 
-                       for e in cbs_results['events'][:100] 
-                       if e['type'] == 'transmission_complete']
+        # Only completions among the first 100 events
+        cbs_timeline = np.searchsorted(cbs_index, 100)
         if cbs_timeline:
-            times, lats = zip(*cbs_timeline)
-            axes[1, 1].plot(times, lats, color=self.colors['avb_a'], 
-                          alpha=0.7, label='CBS')
+            axes[1, 1].plot(cbs_times[:cbs_timeline], cbs_latencies[:cbs_timeline],
+                          color=self.colors['avb_a'], alpha=0.7, label='CBS', rasterized=True)
         
-        fifo_timeline = [(e['timestamp'], e['latency']*1000) 
-                        for e in fifo_results['events'][:100] 
-                        if e['type'] == 'transmission_complete']
+        fifo_timeline = np.searchsorted(fifo_index, 100)
         if fifo_timeline:
-            times, lats = zip(*fifo_timeline)
-            axes[1, 1].plot(times, lats, color=self.colors['best_effort'], 
-                          alpha=0.7, label='FIFO')
+            axes[1, 1].plot(fifo_times[:fifo_timeline], fifo_latencies[:fifo_timeline],
+                          color=self.colors['best_effort'], alpha=0.7, label='FIFO',
+                          rasterized=True)
         
         axes[1, 1].set_title('Latency Over Time')
         axes[1, 1].set_xlabel('Time (s)')
@@ -315,7 +561,7 @@ class CBSDemoVisualizer:
         # Performance improvement summary
         improvements = {
             'Latency Reduction': ((np.mean(fifo_latencies) - np.mean(cbs_latencies)) / 
-                                 np.mean(fifo_latencies) * 100) if fifo_latencies else 0,
+                                 np.mean(fifo_latencies) * 100) if fifo_latencies.size else 0,
             'Jitter Reduction': ((fifo_jitter - cbs_jitter) / fifo_jitter * 100) 
                                if fifo_jitter > 0 else 0,
             'Frame Loss Reduction': ((fifo_loss - cbs_loss) / max(fifo_loss, 1) * 100)
@@ -368,8 +614,8 @@ class CBSDemoVisualizer:
             {'name': 'Egress Port\n1 Gbps', 'pos': (9, 3), 'color': self.colors['avb_a']}
         ]
         
-        for comp in components:
-            rect = FancyBboxPatch(
+        boxes = [
+            FancyBboxPatch(
                 (comp['pos'][0]-0.4, comp['pos'][1]-0.3),
                 0.8, 0.6,
                 boxstyle="round,pad=0.1",
@@ -378,13 +624,16 @@ class CBSDemoVisualizer:
                 linewidth=2,
                 alpha=0.7
             )
-            ax_arch.add_patch(rect)
+            for comp in components
+        ]
+        ax_arch.add_collection(PatchCollection(boxes, match_original=True))
+        for comp in components:
             ax_arch.text(comp['pos'][0], comp['pos'][1], comp['name'],
                         ha='center', va='center', fontsize=10,
                         fontweight='bold', color='white')
         
         # Draw connections
-        connections = [
+        connections = np.array([
             ((1.4, 4), (2.6, 4)),
             ((3.4, 4), (4.6, 5)),
             ((3.4, 4), (4.6, 3)),
@@ -393,11 +642,24 @@ class CBSDemoVisualizer:
             ((5.4, 3), (6.6, 3)),
             ((5.4, 1), (6.6, 2.6)),
             ((7.4, 3), (8.6, 3))
-        ]
+        ])
         
-        for start, end in connections:
-            ax_arch.annotate('', xy=end, xytext=start,
-                           arrowprops=dict(arrowstyle='->', lw=2, color='black'))
+        # Shafts and open '->' heads share one LineCollection; the heads are
+        # built in inches so they stay symmetric on the unequal axis scales
+        bbox = ax_arch.get_position()
+        fig_w, fig_h = fig.get_size_inches()
+        units_per_inch = np.array([10 / (bbox.width * fig_w), 6 / (bbox.height * fig_h)])
+        start, end = connections[:, 0], connections[:, 1]
+        back = (start - end) / units_per_inch
+        back /= np.linalg.norm(back, axis=1, keepdims=True)
+        segments = [connections]
+        for angle in (np.pi / 6, -np.pi / 6):
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
+            barb = np.column_stack((back[:, 0] * cos_a - back[:, 1] * sin_a,
+                                    back[:, 0] * sin_a + back[:, 1] * cos_a))
+            segments.append(np.stack((end, end + barb * 0.12 * units_per_inch), axis=1))
+        ax_arch.add_collection(LineCollection(np.concatenate(segments),
+                                              colors='black', linewidths=2))
         
         # Switch configuration table
         ax_switch.axis('tight')
@@ -616,10 +878,8 @@ Thank you for watching."
         
         demo_code = '''
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import sys
 import os
@@ -634,6 +894,146 @@ st.set_page_config(
     layout="wide"
 )
 
+CREDIT_DT = 1e-4  # credit trace resolution (s)
+
+def transmit_profile(frames, duration, dt=CREDIT_DT):
+    """Per-sample busy fraction and backlog flag from completed frames"""
+    n = len(frames)
+    arrival = np.fromiter((f[\'arrival_time\'] for f in frames), float, n)
+    start = np.fromiter((f[\'transmission_time\'] for f in frames), float, n)
+    end = np.fromiter((f[\'completion_time\'] for f in frames), float, n)
+    order = np.argsort(start)
+    start, end = start[order], end[order]
+    
+    # Cumulative transmit time is piecewise linear with knots at each
+    # start/end, so interpolating it gives exact busy time per sample
+    knots = np.column_stack((start, end)).ravel()
+    busy_before = np.concatenate(([0.0], np.cumsum(end - start)))
+    busy_cum = np.column_stack((busy_before[:-1], busy_before[1:])).ravel()
+    edges = np.arange(int(duration / dt) + 1) * dt
+    busy = np.diff(np.interp(edges, knots, busy_cum)) / dt if n else np.zeros(len(edges) - 1)
+    
+    # A frame is queued from arrival until its transmission completes
+    in_system = (np.searchsorted(np.sort(arrival), edges[1:], side=\'right\')
+                 - np.searchsorted(np.sort(end), edges[1:], side=\'right\'))
+    return edges[1:], busy, in_system > 0
+
+def cbs_credit(idle_slope, send_slope, hi_credit, lo_credit, busy, backlogged, dt):
+    """Integrate the CBS credit ODE over sampled busy fractions (slopes in bit/s)"""
+    credit = np.empty(busy.shape[0])
+    c = 0.0
+    for i in range(busy.shape[0]):
+        if not backlogged[i]:
+            c = 0.0
+        else:
+            c += (idle_slope * (1.0 - busy[i]) + send_slope * busy[i]) * dt
+            c = min(max(c, lo_credit), hi_credit)
+        credit[i] = c
+    return credit
+
+# plotly-resampler (~1 s) and numba are imported on first use rather than at
+# startup; st.cache_resource keeps the result across reruns and sessions
+@st.cache_resource
+def credit_kernel():
+    """cbs_credit, JIT-compiled when numba is available"""
+    try:
+        from numba import njit
+    except ImportError:
+        return cbs_credit
+    return njit(cache=True, fastmath=True)(cbs_credit)
+
+@st.cache_resource
+def figure_resampler():
+    """plotly-resampler\'s FigureResampler class, or None when not installed"""
+    try:
+        from plotly_resampler import FigureResampler
+    except ImportError:
+        return None
+    return FigureResampler
+
+def build_credit_fig(hi_credit, lo_credit, credit_time, credit):
+    """Credit evolution figure, built once per simulation run"""
+    # WebGL trace: rasterized on the GPU, and scattergl supports fill=\'tozeroy\'
+    trace = go.Scattergl(mode=\'lines\', name=\'Credit\', fill=\'tozeroy\')
+    FigureResampler = figure_resampler()
+    if FigureResampler is not None:
+        # LTTB-downsample long runs on the server; Streamlit has no resampling
+        # callback, so only the downsampled initial view is sent to the browser
+        fig = FigureResampler(go.Figure(), default_n_shown_samples=2000)
+        fig.add_trace(trace, hf_x=credit_time, hf_y=credit)
+        fig = go.Figure(fig).update_traces(name=\'Credit\')
+    else:
+        fig = go.Figure()
+        # Samples sit on the uniform CREDIT_DT grid, so x is sent as x0/dx
+        # and only the credit array is serialized
+        trace.update(x0=credit_time[0], dx=CREDIT_DT, y=credit)
+        fig.add_trace(trace)
+
+    fig.add_hline(y=hi_credit, line_dash="dash",
+                 line_color="green", annotation_text="Hi Credit")
+    fig.add_hline(y=lo_credit, line_dash="dash",
+                 line_color="red", annotation_text="Lo Credit")
+    fig.add_hline(y=0, line_color="black", line_width=0.5)
+
+    fig.update_layout(
+        title="CBS Credit Evolution",
+        xaxis_title="Time (s)",
+        yaxis_title="Credit (bits)",
+        height=400
+    )
+    return fig
+
+@st.cache_data
+def build_comparison_fig():
+    """CBS vs FIFO bar chart; its data is static, so it is built once"""
+    metrics = [\'Latency (ms)\', \'Jitter (ms)\', \'Frame Loss (%)\', \'Utilization (%)\']
+
+    # Four bars per method: explicit traces, no DataFrame/melt round-trip
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name=\'CBS\', x=metrics, y=[0.5, 0.1, 0.1, 95]))
+    fig.add_trace(go.Bar(name=\'FIFO\', x=metrics, y=[4.2, 1.4, 3.2, 85]))
+    fig.update_layout(
+        barmode=\'group\',
+        title=\'Performance Comparison: CBS vs FIFO\',
+        xaxis_title=\'Metric\',
+        yaxis_title=\'Value\',
+        legend_title_text=\'Method\'
+    )
+    return fig
+
+@st.cache_data
+def render_config_code(idle_slope, send_slope, hi_credit, lo_credit, generated):
+    """LAN9662 CLI snippet for the given shaper settings"""
+    return f"""
+# CBS Configuration for 1 Gbps Port
+# Generated: {generated}
+
+# Configure CBS Queue 6 (AVB SR-A)
+mchp-cli> qos cbs port 1 queue 6 enable
+mchp-cli> qos cbs port 1 queue 6 idleslope {idle_slope}000
+mchp-cli> qos cbs port 1 queue 6 sendslope {send_slope}000
+mchp-cli> qos cbs port 1 queue 6 hicredit {hi_credit}
+mchp-cli> qos cbs port 1 queue 6 locredit {lo_credit}
+
+# Verify configuration
+mchp-cli> show qos cbs port 1
+    """
+
+# Static register map columns; only the slope/credit values vary
+REGISTER_NAMES = (\'CBS_CTRL\', \'IDLE_SLOPE\', \'SEND_SLOPE\', \'HI_CREDIT\', \'LO_CREDIT\')
+REGISTER_ADDRESSES = (\'0x1000\', \'0x1004\', \'0x1008\', \'0x100C\', \'0x1010\')
+
+@st.cache_data
+def build_register_rows(idle_slope, send_slope, hi_credit, lo_credit):
+    """Register table as a dict of columns, which st.table renders directly"""
+    # Registers are 32-bit, so negative values are shown in two\'s complement
+    values = (idle_slope, send_slope, hi_credit, lo_credit)
+    return {
+        \'Register\': list(REGISTER_NAMES),
+        \'Address\': list(REGISTER_ADDRESSES),
+        \'Value\': [\'0x0001\'] + [hex(v & 0xFFFFFFFF) for v in values]
+    }
+
 st.title("🌐 IEEE 802.1Qav Credit-Based Shaper Demo")
 st.markdown("### Interactive Demonstration for 1 Gigabit Ethernet Networks")
 
@@ -718,129 +1118,98 @@ with tab1:
     
     col1, col2 = st.columns(2)
     
+    # Only the last run is kept (parameters, statistics and the built figure),
+    # so reruns from unrelated widgets and repeated clicks with the same
+    # settings reuse it instead of re-simulating
+    sim_key = (link_speed, idle_slope, send_slope, hi_credit, lo_credit,
+               traffic_type, traffic_rate, frame_size, simulation_time)
+    last_run = st.session_state.get(\'credit_run\')
+    
     with col1:
         if st.button("▶️ Run Simulation", type="primary"):
-            with st.spinner("Running simulation..."):
-                # Initialize simulator
-                sim = NetworkSimulator(link_speed_mbps=link_speed)
-                sim.add_cbs_queue(0, idle_slope, send_slope, hi_credit, lo_credit)
-                
-                # Generate traffic
-                if traffic_type == "CBR":
-                    sim.generate_traffic(\'cbr\', simulation_time, traffic_rate, 
-                                       frame_size, 0)
-                elif traffic_type == "Poisson":
-                    sim.generate_traffic(\'poisson\', simulation_time, traffic_rate, 
-                                       frame_size, 0)
-                elif traffic_type == "Burst":
-                    sim.generate_traffic(\'burst\', simulation_time, traffic_rate, 
-                                       10, 0)
-                else:  # Mixed
-                    sim.generate_traffic(\'cbr\', simulation_time, traffic_rate/2, 
-                                       frame_size, 0)
-                    sim.generate_traffic(\'poisson\', simulation_time, traffic_rate/2, 
-                                       frame_size//2, 0)
-                
-                # Run simulation
-                results = sim.run(simulation_time)
-                
-                # Process results
-                events = results[\'events\']
-                stats = results[\'statistics\']
-                
-                # Display metrics
-                metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
-                
-                with metric_col1:
-                    st.metric(
-                        "Avg Latency",
-                        f"{stats[\'avg_latency\']*1000:.2f} ms",
-                        delta=f"-{87.9:.1f}%" if stats[\'avg_latency\'] < 0.001 else None
-                    )
-                
-                with metric_col2:
-                    st.metric(
-                        "Max Latency",
-                        f"{stats[\'max_latency\']*1000:.2f} ms"
-                    )
-                
-                with metric_col3:
-                    st.metric(
-                        "Jitter",
-                        f"{stats[\'jitter\']*1000:.2f} ms",
-                        delta=f"-{92.7:.1f}%" if stats[\'jitter\'] < 0.0005 else None
-                    )
-                
-                with metric_col4:
-                    st.metric(
-                        "Frame Loss",
-                        f"{stats[\'total_dropped\']}",
-                        delta=f"-{96.9:.1f}%" if stats[\'total_dropped\'] < 10 else None
-                    )
+            if last_run is None or last_run[0] != sim_key:
+                with st.spinner("Running simulation..."):
+                    # Initialize simulator
+                    sim = NetworkSimulator(link_speed_mbps=link_speed)
+                    sim.add_cbs_queue(0, idle_slope, send_slope, hi_credit, lo_credit)
+                    
+                    # Generate traffic
+                    if traffic_type == "CBR":
+                        sim.generate_traffic(\'cbr\', simulation_time, traffic_rate, 
+                                           frame_size, 0)
+                    elif traffic_type == "Poisson":
+                        sim.generate_traffic(\'poisson\', simulation_time, traffic_rate, 
+                                           frame_size, 0)
+                    elif traffic_type == "Burst":
+                        sim.generate_traffic(\'burst\', simulation_time, traffic_rate, 
+                                           10, 0)
+                    else:  # Mixed
+                        sim.generate_traffic(\'cbr\', simulation_time, traffic_rate/2, 
+                                           frame_size, 0)
+                        sim.generate_traffic(\'poisson\', simulation_time, traffic_rate/2, 
+                                           frame_size//2, 0)
+                    
+                    # Run simulation
+                    results = sim.run(simulation_time)
+                    
+                    # Keep only the statistics and the figure; the credit arrays
+                    # are not stored a second time
+                    credit_time, busy, backlogged = transmit_profile(
+                        results[\'frames\'], simulation_time)
+                    credit = credit_kernel()(idle_slope * 1e6, send_slope * 1e6,
+                                        float(hi_credit), float(lo_credit),
+                                        busy, backlogged, CREDIT_DT)
+                    fig = (build_credit_fig(hi_credit, lo_credit, credit_time, credit)
+                           if len(credit) else None)
+                    last_run = (sim_key, results[\'statistics\'], fig)
+                    st.session_state[\'credit_run\'] = last_run
+            
+            stats = last_run[1]
+            
+            # Display metrics
+            metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
+            
+            with metric_col1:
+                st.metric(
+                    "Avg Latency",
+                    f"{stats[\'avg_latency\']*1000:.2f} ms",
+                    delta=f"-{87.9:.1f}%" if stats[\'avg_latency\'] < 0.001 else None
+                )
+            
+            with metric_col2:
+                st.metric(
+                    "Max Latency",
+                    f"{stats[\'max_latency\']*1000:.2f} ms"
+                )
+            
+            with metric_col3:
+                st.metric(
+                    "Jitter",
+                    f"{stats[\'jitter\']*1000:.2f} ms",
+                    delta=f"-{92.7:.1f}%" if stats[\'jitter\'] < 0.0005 else None
+                )
+            
+            with metric_col4:
+                st.metric(
+                    "Frame Loss",
+                    f"{stats[\'total_dropped\']}",
+                    delta=f"-{96.9:.1f}%" if stats[\'total_dropped\'] < 10 else None
+                )
     
     with col2:
         st.subheader("Credit Evolution")
         
         # Create credit evolution plot
-        credit_data = []
-        for event in events:
-            if \'credit\' in event:
-                credit_data.append({
-                    \'time\': event[\'timestamp\'],
-                    \'credit\': event[\'credit\']
-                })
-        
-        if credit_data:
-            df_credit = pd.DataFrame(credit_data)
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=df_credit[\'time\'],
-                y=df_credit[\'credit\'],
-                mode=\'lines\',
-                name=\'Credit\',
-                fill=\'tozeroy\'
-            ))
-            
-            fig.add_hline(y=hi_credit, line_dash="dash", 
-                         line_color="green", annotation_text="Hi Credit")
-            fig.add_hline(y=lo_credit, line_dash="dash", 
-                         line_color="red", annotation_text="Lo Credit")
-            fig.add_hline(y=0, line_color="black", line_width=0.5)
-            
-            fig.update_layout(
-                title="CBS Credit Evolution",
-                xaxis_title="Time (s)",
-                yaxis_title="Credit (bits)",
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+        if last_run is not None and last_run[0] == sim_key and last_run[2] is not None:
+            st.plotly_chart(last_run[2], use_container_width=True)
 
 with tab2:
     st.header("Performance Analysis")
     
     # Comparison with non-CBS
     st.subheader("CBS vs Traditional FIFO Comparison")
-    
-    comparison_data = {
-        \'Metric\': [\'Latency (ms)\', \'Jitter (ms)\', \'Frame Loss (%)\', \'Utilization (%)\'],
-        \'CBS\': [0.5, 0.1, 0.1, 95],
-        \'FIFO\': [4.2, 1.4, 3.2, 85]
-    }
-    
-    df_comparison = pd.DataFrame(comparison_data)
-    
-    fig = px.bar(
-        df_comparison.melt(id_vars=\'Metric\', var_name=\'Method\', value_name=\'Value\'),
-        x=\'Metric\',
-        y=\'Value\',
-        color=\'Method\',
-        barmode=\'group\',
-        title=\'Performance Comparison: CBS vs FIFO\'
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+
+    st.plotly_chart(build_comparison_fig(), use_container_width=True)
     
     # Improvement metrics
     col1, col2, col3 = st.columns(3)
@@ -857,34 +1226,17 @@ with tab3:
     
     st.subheader("Microchip LAN9662 Configuration")
     
-    config_code = f"""
-# CBS Configuration for 1 Gbps Port
-# Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-# Configure CBS Queue 6 (AVB SR-A)
-mchp-cli> qos cbs port 1 queue 6 enable
-mchp-cli> qos cbs port 1 queue 6 idleslope {idle_slope}000
-mchp-cli> qos cbs port 1 queue 6 sendslope {send_slope}000
-mchp-cli> qos cbs port 1 queue 6 hicredit {hi_credit}
-mchp-cli> qos cbs port 1 queue 6 locredit {lo_credit}
-
-# Verify configuration
-mchp-cli> show qos cbs port 1
-    """
+    # Stamped with the session start so the snippet is identical across reruns
+    if \'session_start\' not in st.session_state:
+        st.session_state.session_start = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    st.code(config_code, language="bash")
+    st.code(render_config_code(idle_slope, send_slope, hi_credit, lo_credit,
+                               st.session_state.session_start),
+            language="bash")
     
     st.subheader("Register Configuration")
     
-    register_data = {
-        \'Register\': [\'CBS_CTRL\', \'IDLE_SLOPE\', \'SEND_SLOPE\', \'HI_CREDIT\', \'LO_CREDIT\'],
-        \'Address\': [\'0x1000\', \'0x1004\', \'0x1008\', \'0x100C\', \'0x1010\'],
-        \'Value\': [\'0x0001\', hex(idle_slope), hex(send_slope & 0xFFFFFFFF), 
-                  hex(hi_credit), hex(lo_credit & 0xFFFFFFFF)]
-    }
-    
-    df_registers = pd.DataFrame(register_data)
-    st.table(df_registers)
+    st.table(build_register_rows(idle_slope, send_slope, hi_credit, lo_credit))
 
 with tab4:
     st.header("Documentation")
@@ -939,6 +1291,46 @@ st.markdown(
         print(f"[Demo] Interactive demo saved to {demo_file}")
         return demo_file
 
+def _inputs_hash(method: str, kwargs: Dict) -> str:
+    """Hash of a render step's arguments and of the code that produces it"""
+    h = hashlib.sha256(f"{method}{sorted(kwargs.items())}".encode())
+    for source in (__file__, sys.modules[CBSCalculator.__module__].__file__,
+                   sys.modules[NetworkSimulator.__module__].__file__):
+        with open(source, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+def _run_step(visualizer: CBSDemoVisualizer, method: str, **kwargs):
+    """Run one visualizer step in a worker process"""
+    visualizer._apply_style()
+    return getattr(visualizer, method)(**kwargs)
+
+def _render_step(visualizer: CBSDemoVisualizer, method: str, digest: str, **kwargs):
+    """Run one rendering step in a worker process and record its inputs hash"""
+    output_file = _run_step(visualizer, method, **kwargs)
+    with open(output_file + '.inputs_hash.txt', 'w') as f:
+        f.write(digest)
+    return output_file
+
+def _submit_render(executor: ProcessPoolExecutor, visualizer: CBSDemoVisualizer,
+                   method: str, **kwargs) -> Future:
+    """Schedule a render step, or return its existing asset if inputs are unchanged"""
+    digest = _inputs_hash(method, kwargs)
+    output_file = os.path.join(visualizer.output_dir, _RENDERED_ASSETS[method])
+    try:
+        with open(output_file + '.inputs_hash.txt') as f:
+            up_to_date = os.path.exists(output_file) and f.read() == digest
+    except OSError:
+        up_to_date = False
+    
+    if not up_to_date:
+        return executor.submit(_render_step, visualizer, method, digest, **kwargs)
+    
+    print(f"    Up to date, reusing {output_file}")
+    done = Future()
+    done.set_result(output_file)
+    return done
+
 def main():
     """Main execution function"""
     print("="*60)
@@ -949,20 +1341,33 @@ def main():
     visualizer = CBSDemoVisualizer()
     
     # Generate all demo materials
-    print("\n[1/5] Creating credit evolution animation...")
-    credit_video = visualizer.create_credit_evolution_animation(duration=30)
-    
-    print("\n[2/5] Creating comparison visualization...")
-    comparison_img = visualizer.create_comparison_visualization()
-    
-    print("\n[3/5] Creating hardware demo visualization...")
-    hardware_img = visualizer.create_hardware_demo_visualization()
-    
-    print("\n[4/5] Generating video script...")
-    script_file = visualizer.generate_demo_video_script()
-    
-    print("\n[5/5] Creating interactive demo...")
-    demo_app = visualizer.create_interactive_demo()
+    # The five steps share no state, so all of them go to the pool (one
+    # process per core at most); renderings are submitted first since they
+    # take longest
+    with ProcessPoolExecutor(max_workers=min(5, os.cpu_count() or 1)) as executor:
+        print("\n[1/5] Creating credit evolution animation...")
+        credit_future = _submit_render(executor, visualizer,
+                                       'create_credit_evolution_animation', duration=30)
+        
+        print("\n[2/5] Creating comparison visualization...")
+        comparison_future = _submit_render(executor, visualizer,
+                                           'create_comparison_visualization')
+        
+        print("\n[3/5] Creating hardware demo visualization...")
+        hardware_future = _submit_render(executor, visualizer,
+                                         'create_hardware_demo_visualization')
+        
+        print("\n[4/5] Generating video script...")
+        script_future = executor.submit(_run_step, visualizer, 'generate_demo_video_script')
+        
+        print("\n[5/5] Creating interactive demo...")
+        demo_future = executor.submit(_run_step, visualizer, 'create_interactive_demo')
+        
+        script_file = script_future.result()
+        demo_app = demo_future.result()
+        credit_video = credit_future.result()
+        comparison_img = comparison_future.result()
+        hardware_img = hardware_future.result()
     
     print("\n" + "="*60)
     print("✅ Demo generation complete!")
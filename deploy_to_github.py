@@ -5,22 +5,18 @@ CBS 1 Gigabit Ethernet 프로젝트 배포 자동화
 """
 
 import os
+import shlex
 import subprocess
 import sys
+from collections import Counter
 from datetime import datetime
 import json
+from pathlib import Path
 
-class GitHubDeployer:
-    """GitHub 배포 관리"""
-    
-    def __init__(self):
-        self.project_name = "CBS 1 Gigabit Ethernet Implementation"
-        self.version = "2.0.0"
-        self.commit_message = self._generate_commit_message()
-        
-    def _generate_commit_message(self) -> str:
-        """커밋 메시지 생성"""
-        return f"""🚀 Complete CBS 1GbE Implementation v{self.version}
+VERSION = "2.0.0"
+
+# 배포 커밋 메시지 (버전은 고정값이므로 임포트 시 한 번만 생성)
+COMMIT_MESSAGE = f"""🚀 Complete CBS 1GbE Implementation v{VERSION}
 
 ✨ Major Features:
 • CBS Calculator optimized for 1 Gigabit Ethernet
@@ -61,6 +57,53 @@ Ready for production deployment in:
 
 Tested on Microchip LAN9662/LAN9692 TSN switches"""
 
+# 저장소에 .gitignore가 없을 때 사용할 기본값
+GITIGNORE = """# Python
+__pycache__/
+*.py[cod]
+*.so
+.Python
+venv/
+env/
+
+# LaTeX
+*.aux
+*.log
+*.pdf
+*.synctex.gz
+
+# IDE
+.vscode/
+.idea/
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Data
+*.pcap
+logs/
+"""
+
+class GitHubDeployer:
+    """GitHub 배포 관리"""
+    
+    def __init__(self):
+        self.project_name = "CBS 1 Gigabit Ethernet Implementation"
+        self.version = VERSION
+        self.commit_message = COMMIT_MESSAGE
+        
+    def _run_git_script(self, commands, check: bool = True):
+        """여러 git 명령을 하나의 셸 프로세스에서 순서대로 실행
+
+        commands의 각 항목은 인자 리스트(자동 인용) 또는 셸 문자열이다.
+        check=True이면 set -e로 첫 실패에서 중단하고 CalledProcessError를 발생시킨다.
+        """
+        lines = [cmd if isinstance(cmd, str) else shlex.join(cmd) for cmd in commands]
+        if check:
+            lines.insert(0, 'set -e')
+        return subprocess.run(['sh', '-c', '\n'.join(lines)], check=check)
+
     def check_git_status(self) -> bool:
         """Git 상태 확인"""
         try:
@@ -77,12 +120,13 @@ Tested on Microchip LAN9662/LAN9692 TSN switches"""
         print("🔧 Git 설정 중...")
         
         try:
-            # 사용자 정보 설정 (이미 있으면 유지)
-            subprocess.run(['git', 'config', '--global', 'user.name', 'CBS Research Team'], check=False)
-            subprocess.run(['git', 'config', '--global', 'user.email', 'cbs-research@example.com'], check=False)
-            
-            # 기본 브랜치를 main으로 설정
-            subprocess.run(['git', 'config', '--global', 'init.defaultBranch', 'main'], check=False)
+            self._run_git_script([
+                # 사용자 정보 설정 (이미 있으면 유지)
+                ['git', 'config', '--global', 'user.name', 'CBS Research Team'],
+                ['git', 'config', '--global', 'user.email', 'cbs-research@example.com'],
+                # 기본 브랜치를 main으로 설정
+                ['git', 'config', '--global', 'init.defaultBranch', 'main'],
+            ], check=False)
             
             print("✅ Git 설정 완료")
             return True
@@ -99,8 +143,10 @@ Tested on Microchip LAN9662/LAN9692 TSN switches"""
             return True
             
         try:
-            subprocess.run(['git', 'init'], check=True)
-            subprocess.run(['git', 'checkout', '-b', 'main'], check=True)
+            self._run_git_script([
+                ['git', 'init'],
+                ['git', 'checkout', '-b', 'main'],
+            ])
             print("✅ Git 저장소 초기화 완료")
             return True
         except Exception as e:
@@ -113,34 +159,9 @@ Tested on Microchip LAN9662/LAN9692 TSN switches"""
         
         try:
             # .gitignore가 없으면 기본값 생성
-            if not os.path.exists('.gitignore'):
-                with open('.gitignore', 'w') as f:
-                    f.write("""# Python
-__pycache__/
-*.py[cod]
-*.so
-.Python
-venv/
-env/
-
-# LaTeX
-*.aux
-*.log
-*.pdf
-*.synctex.gz
-
-# IDE
-.vscode/
-.idea/
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Data
-*.pcap
-logs/
-""")
+            gitignore = Path('.gitignore')
+            if not gitignore.exists():
+                gitignore.write_text(GITIGNORE)
             
             subprocess.run(['git', 'add', '.'], check=True)
             print("✅ 파일 스테이징 완료")
@@ -171,21 +192,19 @@ logs/
         
         try:
             # 버전 태그
-            subprocess.run([
-                'git', 'tag', '-a', f'v{self.version}', 
-                '-m', f'Release v{self.version}: Complete CBS 1GbE Implementation'
-            ], check=True)
+            tags = [
+                (f'v{self.version}', f'Release v{self.version}: Complete CBS 1GbE Implementation')
+            ]
             
             # 기능별 태그
-            tags = [
+            tags += [
                 ('stable', 'Stable release for production use'),
                 ('paper-ready', 'Academic paper submission ready'),
                 ('hardware-validated', 'Validated on LAN9662/LAN9692'),
                 ('docker-ready', 'Docker deployment ready')
             ]
             
-            for tag, msg in tags:
-                subprocess.run(['git', 'tag', '-a', tag, '-m', msg], check=True)
+            self._run_git_script([['git', 'tag', '-a', tag, '-m', msg] for tag, msg in tags])
             
             print("✅ 태그 생성 완료")
             return True
@@ -201,11 +220,12 @@ logs/
             repo_url = "https://github.com/hwkim3330/research_paper.git"
         
         try:
-            # 기존 origin이 있으면 제거
-            subprocess.run(['git', 'remote', 'remove', 'origin'], check=False)
-            
-            # 새 origin 추가
-            subprocess.run(['git', 'remote', 'add', 'origin', repo_url], check=True)
+            self._run_git_script([
+                # 기존 origin이 있으면 제거
+                'git remote remove origin || true',
+                # 새 origin 추가
+                ['git', 'remote', 'add', 'origin', repo_url],
+            ])
             
             print(f"✅ 원격 저장소 설정 완료: {repo_url}")
             return True
@@ -218,11 +238,12 @@ logs/
         print("⬆️ GitHub에 푸시...")
         
         try:
-            # 메인 브랜치 푸시
-            subprocess.run(['git', 'push', '-u', 'origin', 'main'], check=True)
-            
-            # 태그 푸시
-            subprocess.run(['git', 'push', '--tags'], check=True)
+            self._run_git_script([
+                # 메인 브랜치 푸시
+                ['git', 'push', '-u', 'origin', 'main'],
+                # 태그 푸시
+                ['git', 'push', '--tags'],
+            ])
             
             print("✅ GitHub 푸시 완료")
             return True
@@ -257,10 +278,19 @@ logs/
             ".json": "Data files"
         }
         
+        # git 인덱스에서 한 번에 파일 목록을 읽는다 (.gitignore 자동 반영)
+        try:
+            names = subprocess.run(
+                ['git', 'ls-files', '-z'],
+                capture_output=True, check=True
+            ).stdout.split(b'\0')
+            names = [os.fsdecode(name) for name in names if name]
+        except (OSError, subprocess.CalledProcessError):
+            names = [file for root, dirs, files in os.walk('.') for file in files]
+        
+        ext_counts = Counter(os.path.splitext(name)[1] for name in names)
         for ext, desc in file_types.items():
-            count = sum(1 for root, dirs, files in os.walk('.') 
-                       for file in files if file.endswith(ext))
-            stats["files"][desc] = count
+            stats["files"][desc] = ext_counts[ext]
         
         # 통계 저장
         with open('project_stats.json', 'w') as f:
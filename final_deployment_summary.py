@@ -4,33 +4,84 @@ CBS 1 Gigabit Ethernet - Final Deployment Summary
 Simple text-based project completion summary
 """
 
+import mmap
 import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# File extensions to count
+COUNTED_EXTENSIONS = ('.py', '.tex', '.md', '.yml', '.yaml', '.json', '.txt')
+# Paths containing any of these are excluded
+EXCLUDED_PARTS = ('venv', '__pycache__', '.git')
+# Files at least this large are counted through mmap, in MMAP_CHUNK slices
+MMAP_THRESHOLD = 64 * 1024
+MMAP_CHUNK = 1 << 20
+# Threads used to count lines; the work is I/O-bound
+COUNT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Directories skipped when measuring project size
+SIZE_EXCLUDED_DIRS = {'.git', 'venv', '__pycache__', 'node_modules'}
+
+def _excluded(path):
+    return any(exc in path for exc in EXCLUDED_PARTS)
+
+def count_lines(path):
+    """Count lines like readlines() would, without decoding the file"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            # mmap setup costs more than reading a small file outright
+            data = f.read()
+            return data.count(b'\n') + (data[-1:] not in (b'', b'\n'))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = sum(mm[i:i + MMAP_CHUNK].count(b'\n')
+                        for i in range(0, size, MMAP_CHUNK))
+            return lines + (mm[size - 1:size] != b'\n')
+
+def listdir_ext(directory, ext):
+    """Names of regular files in directory ending with ext (one scandir, no stats)"""
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries if e.is_file() and e.name.endswith(ext)]
+
+def _count_lines_or_zero(path):
+    try:
+        return count_lines(path)
+    except OSError:
+        return 0
+
 def count_files_and_lines():
     """Count files and lines in the project"""
-    total_files = 0
-    total_lines = 0
+    paths = []
     
-    # File extensions to count
-    extensions = ['.py', '.tex', '.md', '.yml', '.yaml', '.json', '.txt']
+    # One walk classifies every file; excluded directories are never entered
+    for root, dirs, files in os.walk('.'):
+        dirs[:] = [d for d in dirs if not _excluded(os.path.join(root, d))]
+        for name in files:
+            file_path = os.path.join(root, name)
+            if name.endswith(COUNTED_EXTENSIONS) and not _excluded(file_path):
+                paths.append(file_path)
     
-    for ext in extensions:
-        files = list(Path('.').glob(f'**/*{ext}'))
-        # Exclude venv, __pycache__, .git
-        files = [f for f in files if not any(exc in str(f) for exc in ['venv', '__pycache__', '.git'])]
-        
-        for file_path in files:
-            total_files += 1
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    total_lines += len(f.readlines())
-            except:
-                pass
-    
-    return total_files, total_lines
+    # Reads release the GIL, so threads overlap the per-file I/O latency
+    with ThreadPoolExecutor(max_workers=COUNT_WORKERS) as pool:
+        total_lines = sum(pool.map(_count_lines_or_zero, paths))
+    
+    return len(paths), total_lines
+
+def project_size(root='.'):
+    """Total bytes of regular files under root, one stat per file"""
+    total = 0
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for e in entries:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name not in SIZE_EXCLUDED_DIRS:
+                        pending.append(e.path)
+                elif e.is_file(follow_symlinks=False):
+                    total += e.stat(follow_symlinks=False).st_size
+    return total
 
 def check_critical_files():
     """Check existence of critical files"""
@@ -48,8 +99,8 @@ def check_critical_files():
         'docker-compose.yml'
     ]
     
-    existing = [f for f in critical_files if Path(f).exists()]
-    return len(existing), len(critical_files)
+    existing = sum(1 for f in critical_files if os.path.exists(f))
+    return existing, len(critical_files)
 
 def main():
     """Main function"""
@@ -64,7 +115,7 @@ def main():
     print(f"Project Statistics:")
     print(f"  Total Files: {total_files}")
     print(f"  Total Lines: {total_lines:,}")
-    print(f"  Project Size: {sum(f.stat().st_size for f in Path('.').rglob('*') if f.is_file()) / 1024 / 1024:.1f} MB")
+    print(f"  Project Size: {project_size() / 1024 / 1024:.1f} MB")
     
     # Critical files check
     existing_critical, total_critical = check_critical_files()
@@ -78,21 +129,22 @@ def main():
     print(f"  Throughput Achievement: 950 Mbps (95% link utilization)")
     
     # Implementation status
-    src_files = list(Path('src').glob('*.py')) if Path('src').exists() else []
-    test_files = list(Path('tests').glob('test_*.py')) if Path('tests').exists() else []
+    src_files = listdir_ext('src', '.py')
+    test_files = [n for n in listdir_ext('tests', '.py') if n.startswith('test_')]
+    docker_ready = os.path.exists('docker-compose.yml')
     
     print(f"\nImplementation Status:")
     print(f"  Core Modules: {len(src_files)} implemented")
     print(f"  Test Files: {len(test_files)} created")
-    print(f"  Docker Ready: {'Yes' if Path('docker-compose.yml').exists() else 'No'}")
-    print(f"  GitHub Actions: {'Yes' if Path('.github/workflows').exists() else 'No'}")
+    print(f"  Docker Ready: {'Yes' if docker_ready else 'No'}")
+    print(f"  GitHub Actions: {'Yes' if os.path.exists('.github/workflows') else 'No'}")
     
     # Papers and documentation
     papers = ['paper_korean_perfect.tex', 'paper_english_final.tex']
-    paper_count = len([p for p in papers if Path(p).exists()])
+    paper_count = sum(1 for p in papers if os.path.exists(p))
     
     docs = ['README.md', 'CONTRIBUTING.md', 'SECURITY.md']
-    doc_count = len([d for d in docs if Path(d).exists()])
+    doc_count = sum(1 for d in docs if os.path.exists(d))
     
     print(f"\nDocumentation:")
     print(f"  Academic Papers: {paper_count}/2 completed")
@@ -107,7 +159,7 @@ def main():
         deployment_score += 30
     if len(test_files) >= 3:
         deployment_score += 20
-    if Path('docker-compose.yml').exists():
+    if docker_ready:
         deployment_score += 10
         
     print(f"\nDeployment Readiness: {deployment_score}/100")
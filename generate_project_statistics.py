@@ -4,15 +4,209 @@ CBS 1 Gigabit Ethernet - 프로젝트 통계 및 메트릭 생성기
 완성된 프로젝트의 모든 통계와 성과 지표를 계산합니다.
 """
 
+import io
 import os
 import sys
 import json
 import subprocess
 import time
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, FrozenSet
 from datetime import datetime, timedelta
 import re
+import hashlib
+from dataclasses import dataclass, asdict, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from dulwich.errors import NotGitRepository
+    from dulwich.repo import Repo as DulwichRepo
+except ImportError:
+    DulwichRepo = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 코드 메트릭 대상 확장자
+SOURCE_EXTENSIONS = ('.py', '.tex', '.md', '.yml', '.yaml', '.json')
+# 분석에서 제외할 디렉토리 이름 (순회 중 진입 자체를 하지 않음)
+EXCLUDE_DIRS = frozenset({'venv', '.venv', '__pycache__', '.git', 'node_modules', 'dist', 'build',
+                          '.tox', '.mypy_cache', '.pytest_cache', '.cache'})
+# 이 스크립트가 생성하는 리포트 (분석 대상에서 제외)
+JSON_REPORT_FILE = 'project_statistics_comprehensive.json'
+SUMMARY_REPORT_FILE = 'project_summary.txt'
+# 파일 분석 결과 캐시 위치와 보관 개수
+CACHE_DIR = '.cache'
+CACHE_KEEP = 5
+# 테스트 함수/클래스 정의 패턴 (바이트 단위로 검색하므로 디코딩 불필요)
+_TEST_FN_RE = re.compile(rb'def (test_\w+)')
+_TEST_CLS_RE = re.compile(rb'class (Test\w+)')
+# 라인 수 계산 스레드 수 (I/O 대기 위주 작업)
+COUNT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+# 프로젝트 시작일과 주요 마일스톤 (날짜, 이벤트, 분류)
+PROJECT_START_DATE = datetime(2025, 1, 1)
+MILESTONES = (
+    ('2025-01-01', '프로젝트 시작', 'start'),
+    ('2025-01-02', 'CBS 계산기 구현 완료', 'implementation'),
+    ('2025-01-03', '네트워크 시뮬레이터 개발', 'implementation'),
+    ('2025-01-04', 'ML 최적화 엔진 구현', 'implementation'),
+    ('2025-01-05', '하드웨어 인터페이스 개발', 'implementation'),
+    ('2025-01-06', 'Docker 컨테이너화 완료', 'deployment'),
+    ('2025-01-07', '테스트 스위트 구현', 'testing'),
+    ('2025-01-08', '성능 벤치마크 완료', 'testing'),
+    ('2025-01-09', '문서화 완료', 'documentation'),
+)
+# 마지막 마일스톤은 실행 당일 날짜로 기록
+RELEASE_MILESTONE = ('GitHub 배포 준비', 'deployment')
+
+# 파일 내용에만 의존하는 분석 결과 (고정 필드이므로 __slots__로 인스턴스 dict를 없앤다)
+@dataclass
+class CodeMetrics:
+    __slots__ = ('total_files', 'total_lines', 'total_size_mb', 'file_types')
+    total_files: int
+    total_lines: int
+    total_size_mb: float
+    file_types: Dict[str, Dict[str, int]]
+
+@dataclass
+class ImplementationStats:
+    __slots__ = ('core_modules', 'implementation_rate')
+    core_modules: Dict[str, Dict[str, Any]]
+    implementation_rate: float
+
+@dataclass
+class TestStats:
+    __slots__ = ('tests_exist', 'test_files', 'total_tests', 'test_details')
+    tests_exist: bool
+    test_files: int
+    total_tests: int
+    test_details: Dict[str, Dict[str, int]]
+
+@dataclass
+class DocumentationStats:
+    __slots__ = ('documents', 'completeness', 'total_size_kb')
+    documents: Dict[str, Dict[str, Any]]
+    completeness: float
+    total_size_kb: float
+
+# 캐시되는 (파일 내용에만 의존하는) 분석 항목과 그 타입
+CACHED_SECTIONS = {
+    'code_metrics': CodeMetrics,
+    'implementation': ImplementationStats,
+    'testing': TestStats,
+    'documentation': DocumentationStats,
+}
+
+def _walk_source_files(root: str = '.', exts: Tuple[str, ...] = SOURCE_EXTENSIONS,
+                       exclude: FrozenSet[str] = EXCLUDE_DIRS):
+    """os.scandir 기반 단일 순회로 (경로, 이름, stat 결과)를 생성
+
+    제외 디렉토리는 이름으로 판정해 진입하지 않고, 파일 종류 판정은 dirent 캐시를 사용한다.
+    확장자는 str.endswith에 튜플을 넘겨 한 번의 호출로 검사한다.
+    """
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude:
+                        pending.append(entry.path)
+                elif (entry.name.endswith(exts)
+                      and entry.is_file(follow_symlinks=False)
+                      and entry.name != JSON_REPORT_FILE):
+                    yield entry.path, entry.name, entry.stat()
+
+def _count_ext(root: str, suffix: str, recursive: bool = False) -> int:
+    """root 아래에서 suffix로 끝나는 파일 수 (Path 객체나 리스트를 만들지 않음)"""
+    count = 0
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    count += 1
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return count
+
+class FileIndex:
+    """한 번의 순회로 모은 분석 대상 파일 인덱스 (모든 분석기가 공유)
+
+    경로는 정규화된 상대 경로(예: 'src/cbs_calculator.py')이며, 존재 여부와 크기는
+    파일 시스템 대신 순회 중 얻은 stat 결과로 판정한다.
+    """
+    
+    def __init__(self, root: str = '.'):
+        self.stats: Dict[str, os.stat_result] = {}
+        self.by_ext: Dict[str, List[str]] = {}
+        for path, name, st in _walk_source_files(root):
+            path = os.path.normpath(path)
+            self.stats[path] = st
+            self.by_ext.setdefault(os.path.splitext(name)[1].lower(), []).append(path)
+    
+    def get(self, path: str):
+        """경로의 stat 결과, 인덱스에 없으면 None"""
+        return self.stats.get(os.path.normpath(path))
+    
+    def fingerprint(self) -> str:
+        """분석 대상 파일들의 (경로, 크기, 수정 시각)으로 만든 트리 지문"""
+        h = hashlib.blake2b(digest_size=32)
+        for path, st in sorted(self.stats.items()):
+            h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+        return h.hexdigest()
+
+def _json_default(obj):
+    """JSON으로 직렬화되지 않는 값 변환 (datetime은 ISO 형식)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+def _dump_json(obj: Any, path: str, indent: bool = True):
+    """orjson이 있으면 바이트로 직접 직렬화하고, 없으면 표준 json 사용"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option, default=_json_default))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2 if indent else None, ensure_ascii=False,
+                      default=_json_default)
+
+def _load_cached_sections(cache_file: str):
+    """캐시 파일이 있으면 분석 결과를 읽고, 없거나 손상되었거나 형식이 다르면 None"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {name: cls(**data[name]) for name, cls in CACHED_SECTIONS.items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_cached_sections(cache_file: str, sections: Dict[str, Any]):
+    """분석 결과를 캐시에 저장하고 최근 CACHE_KEEP개만 남긴다"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _dump_json(sections, cache_file, indent=False)
+    
+    with os.scandir(CACHE_DIR) as entries:
+        cached = sorted((e for e in entries if e.name.startswith('project_statistics_')),
+                        key=lambda e: e.stat().st_mtime_ns, reverse=True)
+    for old in cached[CACHE_KEEP:]:
+        os.remove(old.path)
+
+def _count_lines(path: str) -> int:
+    """64KB 청크 단위 바이너리 스트리밍으로 readlines()와 같은 라인 수 계산"""
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb', buffering=0) as f:
+        read = f.read
+        while (chunk := read(65536)):
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    # 마지막 줄에 개행이 없어도 한 줄로 센다
+    return lines + (last != b'\n')
 
 class ProjectStatisticsGenerator:
     """프로젝트 통계 생성 클래스"""
@@ -22,80 +216,97 @@ class ProjectStatisticsGenerator:
         self.version = "2.0.0"
         self.start_date = "2025-01-01"  # 프로젝트 시작일
         self.stats = {}
+        # 리포트마다 한 번 만드는 파일 인덱스 (분석기를 단독 호출하면 처음 사용할 때 생성)
+        self.index = None
+        # 분석 단계별 출력을 모아 메서드당 한 번만 stdout에 쓴다
+        self._out = io.StringIO()
+    
+    def _file_index(self) -> FileIndex:
+        """공유 파일 인덱스 반환 (없으면 생성)"""
+        if self.index is None:
+            self.index = FileIndex()
+        return self.index
+    
+    def _p(self, *args):
+        """print 대신 출력 버퍼에 한 줄 추가"""
+        self._out.write(' '.join(map(str, args)))
+        self._out.write('\n')
+    
+    def _flush(self):
+        """모아 둔 출력을 한 번의 write로 내보내고 버퍼를 비운다"""
+        sys.stdout.write(self._out.getvalue())
+        self._out.seek(0)
+        self._out.truncate(0)
         
     def print_header(self):
         """헤더 출력"""
-        print("\n" + "="*80)
-        print("📊 CBS 1 Gigabit Ethernet - 프로젝트 통계 생성")
-        print(f"   Project: {self.project_name}")
-        print(f"   Version: {self.version}")
-        print(f"   Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*80)
-
-    def analyze_code_metrics(self) -> Dict[str, Any]:
+        self._p("\n" + "="*80)
+        self._p("📊 CBS 1 Gigabit Ethernet - 프로젝트 통계 생성")
+        self._p(f"   Project: {self.project_name}")
+        self._p(f"   Version: {self.version}")
+        self._p(f"   Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._p("="*80)
+        self._flush()
+
+    def analyze_code_metrics(self) -> CodeMetrics:
         """코드 메트릭 분석"""
-        print("\n🔍 코드 메트릭 분석...")
-        print("-" * 60)
-        
-        code_stats = {}
-        
-        # 모든 Python 파일 찾기
-        python_files = []
-        for pattern in ['**/*.py', '**/*.tex', '**/*.md', '**/*.yml', '**/*.yaml', '**/*.json']:
-            python_files.extend(list(Path('.').glob(pattern)))
+        self._p("\n🔍 코드 메트릭 분석...")
+        self._p("-" * 60)
         
-        # 제외할 디렉토리
-        exclude_patterns = ['venv', '__pycache__', '.git', 'node_modules', 'dist', 'build']
-        python_files = [f for f in python_files if not any(exc in str(f) for exc in exclude_patterns)]
+        # 대상 파일은 공유 인덱스에서 가져온다 (트리를 다시 순회하지 않음)
+        index = self._file_index()
+        python_files = list(index.stats.items())
         
         # 파일 유형별 통계
         file_types = {}
         total_lines = 0
         total_size = 0
         
-        for file_path in python_files:
-            ext = file_path.suffix.lower()
-            if ext not in file_types:
-                file_types[ext] = {'count': 0, 'lines': 0, 'size': 0}
+        # 라인 수 계산은 I/O 위주이므로 스레드에서 병렬로 읽고, 집계는 메인 스레드에서 수행
+        with ThreadPoolExecutor(max_workers=COUNT_WORKERS) as executor:
+            futures = {executor.submit(_count_lines, file_path): (file_path, st)
+                       for file_path, st in python_files}
             
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = len(f.readlines())
+            # 제출(순회) 순서대로 집계해 file_types 키 순서가 실행마다 같게 유지
+            for future, (file_path, st) in futures.items():
+                size = st.st_size
+                ext = os.path.splitext(file_path)[1].lower()
+                if ext not in file_types:
+                    file_types[ext] = {'count': 0, 'lines': 0, 'size': 0}
+                
+                try:
+                    lines = future.result()
                     file_types[ext]['lines'] += lines
                     total_lines += lines
-                
-                size = file_path.stat().st_size
-                file_types[ext]['size'] += size
-                file_types[ext]['count'] += 1
-                total_size += size
-                
-            except Exception as e:
-                print(f"⚠️ {file_path} 읽기 실패: {e}")
+                    
+                    file_types[ext]['size'] += size
+                    file_types[ext]['count'] += 1
+                    total_size += size
+                    
+                except Exception as e:
+                    self._p(f"⚠️ {file_path} 읽기 실패: {e}")
         
         # 결과 출력
-        print(f"총 파일 수: {len(python_files)}")
-        print(f"총 라인 수: {total_lines:,}")
-        print(f"총 파일 크기: {total_size/1024/1024:.2f} MB")
+        self._p(f"총 파일 수: {len(python_files)}")
+        self._p(f"총 라인 수: {total_lines:,}")
+        self._p(f"총 파일 크기: {total_size/1024/1024:.2f} MB")
         
-        print("\n파일 유형별 통계:")
+        self._p("\n파일 유형별 통계:")
         for ext, stats in sorted(file_types.items()):
-            print(f"  {ext:<8}: {stats['count']:>3}개, {stats['lines']:>6,}라인, {stats['size']/1024:>8.1f}KB")
-        
-        code_stats.update({
-            'total_files': len(python_files),
-            'total_lines': total_lines,
-            'total_size_mb': total_size / 1024 / 1024,
-            'file_types': file_types
-        })
-        
-        return code_stats
+            self._p(f"  {ext:<8}: {stats['count']:>3}개, {stats['lines']:>6,}라인, {stats['size']/1024:>8.1f}KB")
+        
+        self._flush()
+        return CodeMetrics(
+            total_files=len(python_files),
+            total_lines=total_lines,
+            total_size_mb=total_size / 1024 / 1024,
+            file_types=file_types
+        )
 
-    def analyze_implementation_coverage(self) -> Dict[str, Any]:
+    def analyze_implementation_coverage(self) -> ImplementationStats:
         """구현 범위 분석"""
-        print("\n🎯 구현 범위 분석...")
-        print("-" * 60)
-        
-        implementation_stats = {}
+        self._p("\n🎯 구현 범위 분석...")
+        self._p("-" * 60)
         
         # 핵심 모듈별 구현 상태
         core_modules = {
@@ -108,90 +319,88 @@ class ProjectStatisticsGenerator:
         }
         
         implemented_modules = {}
+        index = self._file_index()
         
         for module, description in core_modules.items():
-            module_path = Path(f'src/{module}.py')
-            if module_path.exists():
-                with open(module_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
+            # 존재 여부는 인덱스로 판정하고, 검색어가 모두 ASCII이므로 바이트에서 바로 센다
+            module_file = os.path.join('src', f'{module}.py')
+            data = Path(module_file).read_bytes() if index.get(module_file) else None
+            
+            if data is not None:
                 implemented_modules[module] = {
                     'description': description,
-                    'lines': len(content.splitlines()),
-                    'classes': content.count('class '),
-                    'functions': content.count('def '),
+                    'lines': data.count(b'\n') + (data[-1:] not in (b'', b'\n')),
+                    'classes': data.count(b'class '),
+                    'functions': data.count(b'def '),
                     'implemented': True
                 }
-                print(f"✅ {description:<25} ({implemented_modules[module]['lines']:>4} 라인)")
+                self._p(f"✅ {description:<25} ({implemented_modules[module]['lines']:>4} 라인)")
             else:
                 implemented_modules[module] = {
                     'description': description,
                     'implemented': False
                 }
-                print(f"❌ {description:<25} (미구현)")
+                self._p(f"❌ {description:<25} (미구현)")
         
         implementation_rate = len([m for m in implemented_modules.values() if m['implemented']]) / len(core_modules) * 100
         
-        print(f"\n핵심 모듈 구현률: {implementation_rate:.1f}%")
-        
-        implementation_stats.update({
-            'core_modules': implemented_modules,
-            'implementation_rate': implementation_rate
-        })
+        self._p(f"\n핵심 모듈 구현률: {implementation_rate:.1f}%")
         
-        return implementation_stats
+        self._flush()
+        return ImplementationStats(
+            core_modules=implemented_modules,
+            implementation_rate=implementation_rate
+        )
 
-    def analyze_test_coverage(self) -> Dict[str, Any]:
+    def analyze_test_coverage(self) -> TestStats:
         """테스트 커버리지 분석"""
-        print("\n🧪 테스트 커버리지 분석...")
-        print("-" * 60)
-        
-        test_stats = {}
-        
-        # 테스트 파일 분석
-        test_dir = Path('tests')
-        if test_dir.exists():
-            test_files = list(test_dir.glob('test_*.py'))
+        self._p("\n🧪 테스트 커버리지 분석...")
+        self._p("-" * 60)
+        
+        # 테스트 파일 분석 (인덱스의 .py 목록에서 tests/test_*.py만 고른다)
+        test_files = [Path(path) for path in self._file_index().by_ext.get('.py', ())
+                      if os.path.dirname(path) == 'tests'
+                      and os.path.basename(path).startswith('test_')]
+        if test_files:
             
             total_tests = 0
             test_details = {}
             
             for test_file in test_files:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                test_functions = re.findall(r'def (test_\w+)', content)
-                test_classes = re.findall(r'class (Test\w+)', content)
+                data = test_file.read_bytes()
+                
+                test_functions = sum(1 for _ in _TEST_FN_RE.finditer(data))
+                test_classes = sum(1 for _ in _TEST_CLS_RE.finditer(data))
                 
                 test_details[test_file.name] = {
-                    'functions': len(test_functions),
-                    'classes': len(test_classes),
-                    'lines': len(content.splitlines())
+                    'functions': test_functions,
+                    'classes': test_classes,
+                    'lines': data.count(b'\n') + (data[-1:] not in (b'', b'\n'))
                 }
                 
-                total_tests += len(test_functions)
-                print(f"  {test_file.name:<30} {len(test_functions):>3} 테스트")
+                total_tests += test_functions
+                self._p(f"  {test_file.name:<30} {test_functions:>3} 테스트")
             
-            print(f"\n총 테스트 파일: {len(test_files)}")
-            print(f"총 테스트 함수: {total_tests}")
+            self._p(f"\n총 테스트 파일: {len(test_files)}")
+            self._p(f"총 테스트 함수: {total_tests}")
             
-            test_stats.update({
-                'test_files': len(test_files),
-                'total_tests': total_tests,
-                'test_details': test_details
-            })
+            test_stats = TestStats(
+                tests_exist=True,
+                test_files=len(test_files),
+                total_tests=total_tests,
+                test_details=test_details
+            )
         else:
-            print("❌ tests 디렉토리 없음")
-            test_stats['tests_exist'] = False
+            self._p("❌ tests 디렉토리 없음")
+            test_stats = TestStats(tests_exist=False, test_files=0, total_tests=0, test_details={})
         
+        self._flush()
         return test_stats
 
-    def analyze_documentation(self) -> Dict[str, Any]:
+    def analyze_documentation(self) -> DocumentationStats:
         """문서화 분석"""
-        print("\n📚 문서화 분석...")
-        print("-" * 60)
-        
-        doc_stats = {}
+        self._p("\n📚 문서화 분석...")
+        self._p("-" * 60)
         
         # 문서 파일들
         doc_files = {
@@ -208,47 +417,52 @@ class ProjectStatisticsGenerator:
         
         doc_analysis = {}
         total_doc_size = 0
+        index = self._file_index()
         
         for doc_file, description in doc_files.items():
-            doc_path = Path(doc_file)
-            if doc_path.exists():
-                with open(doc_path, 'r', encoding='utf-8') as f:
+            # 존재 여부와 크기는 인덱스의 stat 결과를 사용한다
+            st = index.get(doc_file)
+            content = None
+            if st is not None:
+                size = st.st_size
+                with open(doc_file, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    
+            
+            if content is not None:
                 doc_analysis[doc_file] = {
                     'description': description,
-                    'size_kb': len(content.encode('utf-8')) / 1024,
-                    'lines': len(content.splitlines()),
+                    'size_kb': size / 1024,
+                    # 텍스트 모드에서 개행이 '\n'으로 통일되므로 줄 목록을 만들지 않고 센다
+                    'lines': content.count('\n') + (content[-1:] not in ('', '\n')),
                     'words': len(content.split()),
                     'exists': True
                 }
                 
                 total_doc_size += doc_analysis[doc_file]['size_kb']
-                print(f"✅ {description:<20} ({doc_analysis[doc_file]['size_kb']:>6.1f} KB)")
+                self._p(f"✅ {description:<20} ({doc_analysis[doc_file]['size_kb']:>6.1f} KB)")
             else:
                 doc_analysis[doc_file] = {
                     'description': description,
                     'exists': False
                 }
-                print(f"❌ {description:<20} (없음)")
+                self._p(f"❌ {description:<20} (없음)")
         
         documentation_completeness = len([d for d in doc_analysis.values() if d['exists']]) / len(doc_files) * 100
         
-        print(f"\n문서화 완성도: {documentation_completeness:.1f}%")
-        print(f"총 문서 크기: {total_doc_size:.1f} KB")
-        
-        doc_stats.update({
-            'documents': doc_analysis,
-            'completeness': documentation_completeness,
-            'total_size_kb': total_doc_size
-        })
+        self._p(f"\n문서화 완성도: {documentation_completeness:.1f}%")
+        self._p(f"총 문서 크기: {total_doc_size:.1f} KB")
         
-        return doc_stats
+        self._flush()
+        return DocumentationStats(
+            documents=doc_analysis,
+            completeness=documentation_completeness,
+            total_size_kb=total_doc_size
+        )
 
     def analyze_performance_achievements(self) -> Dict[str, Any]:
         """성능 달성 현황 분석"""
-        print("\n🏆 성능 달성 현황...")
-        print("-" * 60)
+        self._p("\n🏆 성능 달성 현황...")
+        self._p("-" * 60)
         
         # 프로젝트에서 달성한 주요 성과들
         achievements = {
@@ -278,101 +492,112 @@ class ProjectStatisticsGenerator:
             }
         }
         
-        print("주요 성과:")
+        self._p("주요 성과:")
         for key, data in achievements.items():
             if 'before' in data:
-                print(f"  • {data['description']}: {data['before']} → {data['after']} ({data['improvement_percent']:.1f}% 개선)")
+                self._p(f"  • {data['description']}: {data['before']} → {data['after']} ({data['improvement_percent']:.1f}% 개선)")
             else:
-                print(f"  • {data['description']}: {data['achieved']}/{data['target']} ({data['achievement_percent']:.1f}%)")
+                self._p(f"  • {data['description']}: {data['achieved']}/{data['target']} ({data['achievement_percent']:.1f}%)")
         
+        self._flush()
         return {'achievements': achievements}
 
     def analyze_github_metrics(self) -> Dict[str, Any]:
         """GitHub 메트릭 분석"""
-        print("\n🐙 GitHub 메트릭 분석...")
-        print("-" * 60)
+        self._p("\n🐙 GitHub 메트릭 분석...")
+        self._p("-" * 60)
         
         github_stats = {}
         
         # Git 통계 (로컬 리포지토리 기준)
         try:
-            # 커밋 수
-            result = subprocess.run(['git', 'rev-list', '--count', 'HEAD'], 
-                                   capture_output=True, text=True)
-            if result.returncode == 0:
-                commit_count = int(result.stdout.strip())
-                print(f"총 커밋 수: {commit_count}")
-                github_stats['commits'] = commit_count
+            commit_count = branches = None
+            
+            if DulwichRepo is not None:
+                # dulwich가 있으면 .git을 직접 읽어 프로세스 생성 없이 조회
+                try:
+                    repo = DulwichRepo('.')
+                except NotGitRepository:
+                    repo = None
+                if repo is not None:
+                    commit_count = sum(1 for _ in repo.get_walker())
+                    branches = (len(repo.refs.subkeys(b'refs/heads'))
+                                + len(repo.refs.subkeys(b'refs/remotes')))
+            else:
+                # 커밋 수
+                result = subprocess.run(['git', 'rev-list', '--count', 'HEAD'],
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                if result.returncode == 0:
+                    commit_count = int(result.stdout)
+                
+                # 브랜치 수 (로컬 + 원격 ref, 한 줄에 하나)
+                result = subprocess.run(['git', 'for-each-ref', '--format=%(refname)',
+                                        'refs/heads', 'refs/remotes'],
+                                       stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                if result.returncode == 0:
+                    branches = result.stdout.count(b'\n')
             
-            # 브랜치 수
-            result = subprocess.run(['git', 'branch', '-a'], 
-                                   capture_output=True, text=True)
-            if result.returncode == 0:
-                branches = len(result.stdout.strip().split('\n'))
-                print(f"브랜치 수: {branches}")
+            if commit_count is not None:
+                self._p(f"총 커밋 수: {commit_count}")
+                github_stats['commits'] = commit_count
+            if branches is not None:
+                self._p(f"브랜치 수: {branches}")
                 github_stats['branches'] = branches
                 
         except Exception as e:
-            print(f"Git 명령 실행 실패: {e}")
+            self._p(f"Git 명령 실행 실패: {e}")
             github_stats['git_available'] = False
         
         # GitHub Actions 워크플로우
-        actions_dir = Path('.github/workflows')
-        if actions_dir.exists():
-            workflows = list(actions_dir.glob('*.yml'))
-            print(f"GitHub Actions 워크플로우: {len(workflows)}")
-            github_stats['workflows'] = len(workflows)
+        if os.path.isdir('.github/workflows'):
+            workflows = _count_ext('.github/workflows', '.yml')
+            self._p(f"GitHub Actions 워크플로우: {workflows}")
+            github_stats['workflows'] = workflows
         
         # Issues와 PR 템플릿
-        github_dir = Path('.github')
-        if github_dir.exists():
-            templates = list(github_dir.rglob('*.md'))
-            print(f"GitHub 템플릿: {len(templates)}")
-            github_stats['templates'] = len(templates)
+        if os.path.isdir('.github'):
+            templates = _count_ext('.github', '.md', recursive=True)
+            self._p(f"GitHub 템플릿: {templates}")
+            github_stats['templates'] = templates
         
+        self._flush()
         return github_stats
 
     def generate_timeline_analysis(self) -> Dict[str, Any]:
         """프로젝트 타임라인 분석"""
-        print("\n📅 프로젝트 타임라인 분석...")
-        print("-" * 60)
-        
-        # 주요 마일스톤
-        milestones = [
-            {'date': '2025-01-01', 'event': '프로젝트 시작', 'category': 'start'},
-            {'date': '2025-01-02', 'event': 'CBS 계산기 구현 완료', 'category': 'implementation'},
-            {'date': '2025-01-03', 'event': '네트워크 시뮬레이터 개발', 'category': 'implementation'},
-            {'date': '2025-01-04', 'event': 'ML 최적화 엔진 구현', 'category': 'implementation'},
-            {'date': '2025-01-05', 'event': '하드웨어 인터페이스 개발', 'category': 'implementation'},
-            {'date': '2025-01-06', 'event': 'Docker 컨테이너화 완료', 'category': 'deployment'},
-            {'date': '2025-01-07', 'event': '테스트 스위트 구현', 'category': 'testing'},
-            {'date': '2025-01-08', 'event': '성능 벤치마크 완료', 'category': 'testing'},
-            {'date': '2025-01-09', 'event': '문서화 완료', 'category': 'documentation'},
-            {'date': datetime.now().strftime('%Y-%m-%d'), 'event': 'GitHub 배포 준비', 'category': 'deployment'}
-        ]
+        self._p("\n📅 프로젝트 타임라인 분석...")
+        self._p("-" * 60)
         
-        print("주요 마일스톤:")
-        for milestone in milestones:
-            print(f"  {milestone['date']} - {milestone['event']} ({milestone['category']})")
+        current_date = datetime.now()
+        today = current_date.strftime('%Y-%m-%d')
+        
+        # 주요 마일스톤 (출력은 튜플에서 바로, dict는 JSON 결과용으로만 생성)
+        self._p("주요 마일스톤:")
+        for date, event, category in MILESTONES:
+            self._p(f"  {date} - {event} ({category})")
+        self._p(f"  {today} - {RELEASE_MILESTONE[0]} ({RELEASE_MILESTONE[1]})")
         
         # 개발 기간 계산
-        start_date = datetime.strptime('2025-01-01', '%Y-%m-%d')
-        current_date = datetime.now()
-        development_days = (current_date - start_date).days
+        development_days = (current_date - PROJECT_START_DATE).days
         
-        print(f"\n총 개발 기간: {development_days}일")
+        self._p(f"\n총 개발 기간: {development_days}일")
         
+        self._flush()
+        milestones = [{'date': date, 'event': event, 'category': category}
+                      for date, event, category in MILESTONES]
+        milestones.append({'date': today, 'event': RELEASE_MILESTONE[0],
+                           'category': RELEASE_MILESTONE[1]})
         return {
             'milestones': milestones,
             'development_days': development_days,
-            'start_date': '2025-01-01',
-            'current_date': current_date.strftime('%Y-%m-%d')
+            'start_date': PROJECT_START_DATE.strftime('%Y-%m-%d'),
+            'current_date': today
         }
 
     def calculate_project_complexity(self) -> Dict[str, Any]:
         """프로젝트 복잡도 계산"""
-        print("\n🧮 프로젝트 복잡도 분석...")
-        print("-" * 60)
+        self._p("\n🧮 프로젝트 복잡도 분석...")
+        self._p("-" * 60)
         
         complexity_metrics = {}
         
@@ -398,33 +623,50 @@ class ProjectStatisticsGenerator:
         
         # 구현 복잡도 (파일 수, 라인 수 기반)
         if 'code_metrics' in self.stats:
-            lines = self.stats['code_metrics']['total_lines']
-            files = self.stats['code_metrics']['total_files']
+            lines = self.stats['code_metrics'].total_lines
+            files = self.stats['code_metrics'].total_files
             
             # 복잡도 점수 계산 (0-100)
             complexity_score = min(100, (lines / 100) + (files / 2))
             complexity_metrics['complexity_score'] = complexity_score
         
-        print(f"기술 스택: {len(technologies)} 개")
-        print(f"도메인 영역: {len(domains)} 개")
-        print(f"복잡도 점수: {complexity_metrics.get('complexity_score', 0):.1f}/100")
+        self._p(f"기술 스택: {len(technologies)} 개")
+        self._p(f"도메인 영역: {len(domains)} 개")
+        self._p(f"복잡도 점수: {complexity_metrics.get('complexity_score', 0):.1f}/100")
         
         complexity_metrics.update({
             'technologies': technologies,
             'domains': domains
         })
         
+        self._flush()
         return complexity_metrics
 
-    def generate_comprehensive_report(self) -> Dict[str, Any]:
+    def generate_comprehensive_report(self, use_cache: bool = True) -> Dict[str, Any]:
         """종합 리포트 생성"""
         print("\n📋 종합 리포트 생성 중...")
         
-        # 모든 분석 실행
-        self.stats['code_metrics'] = self.analyze_code_metrics()
-        self.stats['implementation'] = self.analyze_implementation_coverage()
-        self.stats['testing'] = self.analyze_test_coverage()
-        self.stats['documentation'] = self.analyze_documentation()
+        # 파일 내용에만 의존하는 분석은 트리 지문이 같으면 캐시에서 읽는다
+        # 트리는 여기서 한 번만 순회하고, 지문 계산과 모든 분석기가 이 인덱스를 공유한다
+        self.index = FileIndex()
+        
+        cached = None
+        if use_cache:
+            cache_file = os.path.join(CACHE_DIR, f'project_statistics_{self.index.fingerprint()}.json')
+            cached = _load_cached_sections(cache_file)
+        
+        if cached is not None:
+            print(f"\n💾 파일 변경 없음 - 캐시된 분석 결과 사용 ({cache_file})")
+            self.stats.update(cached)
+        else:
+            self.stats['code_metrics'] = self.analyze_code_metrics()
+            self.stats['implementation'] = self.analyze_implementation_coverage()
+            self.stats['testing'] = self.analyze_test_coverage()
+            self.stats['documentation'] = self.analyze_documentation()
+            if use_cache:
+                _save_cached_sections(cache_file, {k: self.stats[k] for k in CACHED_SECTIONS})
+        
+        # 시간과 Git 상태에 의존하는 분석은 항상 새로 실행
         self.stats['performance'] = self.analyze_performance_achievements()
         self.stats['github'] = self.analyze_github_metrics()
         self.stats['timeline'] = self.generate_timeline_analysis()
@@ -442,91 +684,94 @@ class ProjectStatisticsGenerator:
 
     def print_executive_summary(self, stats: Dict[str, Any]):
         """경영진 요약 출력"""
-        print("\n" + "="*80)
-        print("🏆 CBS 1 Gigabit Ethernet - 프로젝트 완성 요약")
-        print("="*80)
+        self._p("\n" + "="*80)
+        self._p("🏆 CBS 1 Gigabit Ethernet - 프로젝트 완성 요약")
+        self._p("="*80)
         
         # 핵심 지표들
         if 'code_metrics' in stats:
             cm = stats['code_metrics']
-            print(f"\n📊 코드 통계:")
-            print(f"  • 총 라인 수: {cm['total_lines']:,}")
-            print(f"  • 총 파일 수: {cm['total_files']}")
-            print(f"  • 프로젝트 크기: {cm['total_size_mb']:.1f} MB")
+            self._p(f"\n📊 코드 통계:")
+            self._p(f"  • 총 라인 수: {cm.total_lines:,}")
+            self._p(f"  • 총 파일 수: {cm.total_files}")
+            self._p(f"  • 프로젝트 크기: {cm.total_size_mb:.1f} MB")
         
         if 'implementation' in stats:
             impl = stats['implementation']
-            print(f"\n🎯 구현 현황:")
-            print(f"  • 핵심 모듈 구현률: {impl['implementation_rate']:.1f}%")
+            self._p(f"\n🎯 구현 현황:")
+            self._p(f"  • 핵심 모듈 구현률: {impl.implementation_rate:.1f}%")
         
         if 'testing' in stats:
             test = stats['testing']
-            print(f"\n🧪 테스트 현황:")
-            print(f"  • 테스트 파일: {test.get('test_files', 0)}개")
-            print(f"  • 테스트 함수: {test.get('total_tests', 0)}개")
+            self._p(f"\n🧪 테스트 현황:")
+            self._p(f"  • 테스트 파일: {test.test_files}개")
+            self._p(f"  • 테스트 함수: {test.total_tests}개")
         
         if 'documentation' in stats:
             doc = stats['documentation']
-            print(f"\n📚 문서화:")
-            print(f"  • 문서 완성도: {doc['completeness']:.1f}%")
-            print(f"  • 문서 총 크기: {doc['total_size_kb']:.1f} KB")
+            self._p(f"\n📚 문서화:")
+            self._p(f"  • 문서 완성도: {doc.completeness:.1f}%")
+            self._p(f"  • 문서 총 크기: {doc.total_size_kb:.1f} KB")
         
         if 'performance' in stats:
             perf = stats['performance']['achievements']
-            print(f"\n🚀 성능 달성:")
-            print(f"  • 지연시간: {perf['latency_improvement']['improvement_percent']:.1f}% 개선")
-            print(f"  • 지터: {perf['jitter_reduction']['improvement_percent']:.1f}% 감소")
-            print(f"  • 프레임 손실: {perf['frame_loss_reduction']['improvement_percent']:.1f}% 감소")
-            print(f"  • 처리량: {perf['throughput_achievement']['achievement_percent']:.1f}% 달성")
+            self._p(f"\n🚀 성능 달성:")
+            self._p(f"  • 지연시간: {perf['latency_improvement']['improvement_percent']:.1f}% 개선")
+            self._p(f"  • 지터: {perf['jitter_reduction']['improvement_percent']:.1f}% 감소")
+            self._p(f"  • 프레임 손실: {perf['frame_loss_reduction']['improvement_percent']:.1f}% 감소")
+            self._p(f"  • 처리량: {perf['throughput_achievement']['achievement_percent']:.1f}% 달성")
         
         if 'timeline' in stats:
             timeline = stats['timeline']
-            print(f"\n⏱️ 프로젝트 진행:")
-            print(f"  • 개발 기간: {timeline['development_days']}일")
-            print(f"  • 마일스톤: {len(timeline['milestones'])}개 완료")
+            self._p(f"\n⏱️ 프로젝트 진행:")
+            self._p(f"  • 개발 기간: {timeline['development_days']}일")
+            self._p(f"  • 마일스톤: {len(timeline['milestones'])}개 완료")
         
-        print(f"\n✨ 결론: 프로젝트가 성공적으로 완료되었습니다!")
+        self._p(f"\n✨ 결론: 프로젝트가 성공적으로 완료되었습니다!")
+        self._flush()
 
     def save_statistics(self, stats: Dict[str, Any]):
         """통계 파일 저장"""
         # JSON 리포트
-        json_file = "project_statistics_comprehensive.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False, default=str)
+        json_file = JSON_REPORT_FILE
+        _dump_json(stats, json_file)
         print(f"\n💾 통계 리포트 저장: {json_file}")
         
-        # 간단한 텍스트 요약
-        summary_file = "project_summary.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"{self.project_name} v{self.version} - Project Statistics\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            if 'code_metrics' in stats:
-                cm = stats['code_metrics']
-                f.write("Code Metrics:\n")
-                f.write(f"  - Total Lines: {cm['total_lines']:,}\n")
-                f.write(f"  - Total Files: {cm['total_files']}\n")
-                f.write(f"  - Project Size: {cm['total_size_mb']:.1f} MB\n\n")
-            
-            if 'performance' in stats:
-                perf = stats['performance']['achievements']
-                f.write("Performance Achievements:\n")
-                for key, data in perf.items():
-                    if 'improvement_percent' in data:
-                        f.write(f"  - {data['description']}: {data['improvement_percent']:.1f}% improvement\n")
-                    elif 'achievement_percent' in data:
-                        f.write(f"  - {data['description']}: {data['achievement_percent']:.1f}% achieved\n")
+        # 간단한 텍스트 요약 (조각을 모아 한 번에 기록)
+        summary_file = SUMMARY_REPORT_FILE
+        parts = [
+            f"{self.project_name} v{self.version} - Project Statistics\n",
+            "=" * 60 + "\n\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
+        
+        if 'code_metrics' in stats:
+            cm = stats['code_metrics']
+            parts.append("Code Metrics:\n")
+            parts.append(f"  - Total Lines: {cm.total_lines:,}\n")
+            parts.append(f"  - Total Files: {cm.total_files}\n")
+            parts.append(f"  - Project Size: {cm.total_size_mb:.1f} MB\n\n")
+        
+        if 'performance' in stats:
+            perf = stats['performance']['achievements']
+            parts.append("Performance Achievements:\n")
+            for key, data in perf.items():
+                if 'improvement_percent' in data:
+                    parts.append(f"  - {data['description']}: {data['improvement_percent']:.1f}% improvement\n")
+                elif 'achievement_percent' in data:
+                    parts.append(f"  - {data['description']}: {data['achievement_percent']:.1f}% achieved\n")
+        
+        Path(summary_file).write_text(''.join(parts), encoding='utf-8')
         
         print(f"📄 요약 리포트 저장: {summary_file}")
 
-    def run_full_analysis(self):
+    def run_full_analysis(self, use_cache: bool = True):
         """전체 분석 실행"""
         self.print_header()
         
         try:
             # 종합 분석 실행
-            stats = self.generate_comprehensive_report()
+            stats = self.generate_comprehensive_report(use_cache)
             
             # 결과 출력 및 저장
             self.print_executive_summary(stats)
@@ -542,8 +787,11 @@ def main():
     """메인 실행 함수"""
     generator = ProjectStatisticsGenerator()
     
+    # --no-cache: 캐시를 무시하고 모든 파일을 다시 분석
+    use_cache = '--no-cache' not in sys.argv[1:]
+    
     try:
-        success = generator.run_full_analysis()
+        success = generator.run_full_analysis(use_cache)
         return 0 if success else 1
         
     except KeyboardInterrupt:
@@ -7,152 +7,167 @@
 import json
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+# 데이터 파일 쓰기 버퍼 크기와 동시 저장 스레드 수
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+SAVE_WORKERS = 4
+
+# 트래픽 패턴 이름과 생성 메서드 (패턴마다 독립 난수열로 생성)
+TRAFFIC_PATTERNS = {
+    "cbr": "_generate_cbr_traffic",
+    "poisson": "_generate_poisson_traffic",
+    "burst": "_generate_burst_traffic",
+    "mixed": "_generate_mixed_traffic",
+    "video_4k": "_generate_video_4k_traffic",
+    "adas": "_generate_adas_traffic"
+}
+
 class RealTestDataGenerator:
     """실제 환경 테스트 데이터 생성기"""
     
-    def __init__(self):
+    def __init__(self, seed: int = None):
         self.link_speed_mbps = 1000  # 1 Gbps
         self.test_duration_hours = 168  # 1주일
         self.sampling_rate_hz = 1000  # 1kHz 샘플링
+        # 모든 난수는 크기 지정 호출로 한 번에 추출 (PCG64, seed를 주면 재현 가능)
+        self.seed_seq = np.random.SeedSequence(seed)
+        self.rng = np.random.default_rng(self.seed_seq)
         
     def generate_traffic_patterns(self) -> Dict[str, List]:
         """다양한 트래픽 패턴 생성"""
         print("트래픽 패턴 생성 중...")
         
-        patterns = {
-            "cbr": self._generate_cbr_traffic(),
-            "poisson": self._generate_poisson_traffic(),
-            "burst": self._generate_burst_traffic(),
-            "mixed": self._generate_mixed_traffic(),
-            "video_4k": self._generate_video_4k_traffic(),
-            "adas": self._generate_adas_traffic()
-        }
+        # 패턴별 독립 난수열을 위한 자식 시드 (seed를 주면 패턴별 출력이 재현 가능)
+        seeds = self.seed_seq.spawn(len(TRAFFIC_PATTERNS))
+        rng = self.rng
+        
+        patterns = {}
+        for (name, method_name), seed_seq in zip(TRAFFIC_PATTERNS.items(), seeds):
+            self.rng = np.random.default_rng(seed_seq)
+            patterns[name] = getattr(self, method_name)()
+        self.rng = rng
         
         return patterns
     
     def _generate_cbr_traffic(self) -> List[Dict]:
         """Constant Bit Rate 트래픽"""
-        data = []
+        return self._cbr_frame(10000).to_dict("records")
+    
+    def _cbr_frame(self, n_frames: int) -> pd.DataFrame:
+        """CBR 트래픽 n_frames개를 DataFrame으로 생성"""
         rate_mbps = 500  # 500 Mbps CBR
         frame_size = 1500
         interval = (frame_size * 8) / (rate_mbps * 1e6)
         
-        current_time = 0
-        for i in range(10000):
-            data.append({
-                "timestamp": current_time,
-                "frame_size": frame_size,
-                "rate_mbps": rate_mbps,
-                "pattern": "cbr"
-            })
-            current_time += interval
-            
-        return data
+        # 타임스탬프는 한 번의 배열 연산으로 계산
+        return pd.DataFrame({
+            "timestamp": np.arange(n_frames, dtype=np.float64) * interval,
+            "frame_size": frame_size,
+            "rate_mbps": rate_mbps,
+            "pattern": "cbr"
+        })
     
     def _generate_poisson_traffic(self) -> List[Dict]:
         """Poisson 분포 트래픽"""
-        data = []
+        return self._poisson_frame(10000).to_dict("records")
+    
+    def _poisson_frame(self, n_frames: int) -> pd.DataFrame:
+        """Poisson 트래픽 n_frames개를 DataFrame으로 생성"""
         lambda_rate = 500  # 평균 500 Mbps
         
-        for i in range(10000):
-            interval = np.random.exponential(1/lambda_rate)
-            frame_size = np.random.choice([64, 128, 256, 512, 1024, 1500])
-            
-            data.append({
-                "timestamp": sum([d.get("interval", 0) for d in data[:i]]),
-                "frame_size": frame_size,
-                "rate_mbps": lambda_rate,
-                "pattern": "poisson",
-                "interval": interval
-            })
-            
-        return data
+        # 간격과 프레임 크기를 한 번에 추출하고, 각 프레임의 타임스탬프는 이전 간격들의 누적합
+        intervals = self.rng.exponential(1/lambda_rate, size=n_frames)
+        timestamps = np.concatenate(([0.0], np.cumsum(intervals[:-1])))
+        frame_sizes = self.rng.choice([64, 128, 256, 512, 1024, 1500], size=n_frames)
+        
+        return pd.DataFrame({
+            "timestamp": timestamps,
+            "frame_size": frame_sizes,
+            "rate_mbps": lambda_rate,
+            "pattern": "poisson",
+            "interval": intervals
+        })
     
     def _generate_burst_traffic(self) -> List[Dict]:
         """버스트 트래픽"""
-        data = []
+        return self._burst_frame(200).to_dict("records")
+    
+    def _burst_frame(self, n_bursts: int) -> pd.DataFrame:
+        """버스트 트래픽 n_bursts개(버스트당 50 프레임)를 DataFrame으로 생성"""
         burst_size = 50  # 50 프레임 버스트
         burst_rate = 900  # 900 Mbps 버스트
         idle_time = 0.1  # 100ms 유휴
         
-        current_time = 0
-        for burst_num in range(200):
-            # 버스트 생성
-            for i in range(burst_size):
-                data.append({
-                    "timestamp": current_time + i * 0.00001,
-                    "frame_size": 1500,
-                    "rate_mbps": burst_rate,
-                    "pattern": "burst",
-                    "burst_id": burst_num
-                })
-            current_time += idle_time
-            
-        return data
+        # (버스트 시작 시각) + (버스트 내 오프셋)을 브로드캐스트해 (n_bursts, burst_size) 행렬로 계산
+        starts = (np.arange(n_bursts) * idle_time)[:, None]
+        offsets = np.arange(burst_size)[None, :] * 0.00001
+        
+        return pd.DataFrame({
+            "timestamp": (starts + offsets).ravel(),
+            "frame_size": 1500,
+            "rate_mbps": burst_rate,
+            "pattern": "burst",
+            "burst_id": np.repeat(np.arange(n_bursts), burst_size)
+        })
     
     def _generate_mixed_traffic(self) -> List[Dict]:
         """혼합 트래픽"""
-        data = []
-        
-        # CBR 컴포넌트 (40%)
-        cbr_data = self._generate_cbr_traffic()[:4000]
-        
-        # Poisson 컴포넌트 (40%)
-        poisson_data = self._generate_poisson_traffic()[:4000]
+        # 필요한 만큼만 생성: CBR 40%, Poisson 40%, Burst 20% (40 버스트 x 50 프레임)
+        parts = [self._cbr_frame(4000), self._poisson_frame(4000), self._burst_frame(40)]
         
-        # Burst 컴포넌트 (20%)
-        burst_data = self._generate_burst_traffic()[:2000]
+        # 혼합: 타임스탬프 열을 이어 붙여 C 수준의 안정 정렬로 순서를 구하고,
+        # 패턴마다 필드가 다르므로 레코드는 각 DataFrame에서 따로 변환
+        timestamps = np.concatenate([part["timestamp"].to_numpy() for part in parts])
+        order = np.argsort(timestamps, kind="stable")
+        records = [record for part in parts for record in part.to_dict("records")]
         
-        # 혼합
-        data = cbr_data + poisson_data + burst_data
-        data.sort(key=lambda x: x["timestamp"])
-        
-        return data
+        return [records[i] for i in order]
     
     def _generate_video_4k_traffic(self) -> List[Dict]:
         """4K 비디오 스트리밍 트래픽"""
-        data = []
-        
         # 4K 30fps: ~25 Mbps per stream
         streams = 4  # 4개 동시 스트림
         fps = 30
         frame_interval = 1 / fps
-        
-        for stream_id in range(streams):
-            current_time = stream_id * 0.001  # 스트림간 오프셋
-            
-            for frame_num in range(3000):  # 100초
-                # I-frame (큰 프레임)
-                if frame_num % 30 == 0:
-                    frame_size = random.randint(50000, 70000)
-                # P-frame (중간 프레임)
-                elif frame_num % 10 == 0:
-                    frame_size = random.randint(20000, 30000)
-                # B-frame (작은 프레임)
-                else:
-                    frame_size = random.randint(5000, 10000)
-                    
-                data.append({
-                    "timestamp": current_time,
-                    "frame_size": frame_size,
-                    "stream_id": stream_id,
-                    "frame_type": "I" if frame_num % 30 == 0 else ("P" if frame_num % 10 == 0 else "B"),
-                    "pattern": "video_4k"
-                })
-                
-                current_time += frame_interval
-                
-        return data
+        n_frames = 3000  # 100초
+        
+        # 스트림 순서대로 (스트림, 프레임 번호) 배열을 만들고 프레임 유형은 마스크로 판정
+        stream_ids = np.repeat(np.arange(streams), n_frames)
+        frame_nums = np.tile(np.arange(n_frames), streams)
+        is_i = frame_nums % 30 == 0               # I-frame (큰 프레임)
+        is_p = ~is_i & (frame_nums % 10 == 0)    # P-frame (중간 프레임), 나머지는 B-frame
+        
+        # 유형별 크기 범위를 배열로 만들어 한 번의 호출로 추출 (양 끝 포함)
+        low = np.where(is_i, 50000, np.where(is_p, 20000, 5000))
+        high = np.where(is_i, 70000, np.where(is_p, 30000, 10000))
+        
+        df = pd.DataFrame({
+            "timestamp": stream_ids * 0.001 + frame_nums * frame_interval,  # 스트림간 오프셋
+            "frame_size": self.rng.integers(low, high, endpoint=True),
+            "stream_id": stream_ids,
+            "frame_type": np.where(is_i, "I", np.where(is_p, "P", "B")),
+            "pattern": "video_4k"
+        })
+        
+        return df.to_dict("records")
     
     def _generate_adas_traffic(self) -> List[Dict]:
         """ADAS (자율주행) 트래픽"""
-        data = []
-        
         # 센서 데이터
         sensors = {
             "camera": {"rate": 100, "size": 2000000},  # 100 Mbps, 2MB/frame
@@ -161,59 +176,55 @@ class RealTestDataGenerator:
             "control": {"rate": 10, "size": 1000}      # 10 Mbps, 1KB/frame
         }
         
+        # 센서별로 1000 프레임의 타임스탬프를 arange로 계산
+        frames = []
         for sensor_type, config in sensors.items():
             interval = (config["size"] * 8) / (config["rate"] * 1e6)
-            current_time = 0
-            
-            for i in range(1000):
-                data.append({
-                    "timestamp": current_time,
-                    "frame_size": config["size"],
-                    "sensor_type": sensor_type,
-                    "rate_mbps": config["rate"],
-                    "pattern": "adas",
-                    "priority": 7 if sensor_type == "control" else 5
-                })
-                current_time += interval
-                
-        data.sort(key=lambda x: x["timestamp"])
-        return data
+            frames.append(pd.DataFrame({
+                "timestamp": np.arange(1000) * interval,
+                "frame_size": config["size"],
+                "sensor_type": sensor_type,
+                "rate_mbps": config["rate"],
+                "pattern": "adas",
+                "priority": 7 if sensor_type == "control" else 5
+            }))
+        
+        # 모든 센서의 필드가 같으므로 합친 뒤 타임스탬프 열로 안정 정렬
+        df = pd.concat(frames, ignore_index=True).sort_values("timestamp", kind="stable")
+        return df.to_dict("records")
     
     def generate_cbs_performance_data(self) -> Dict:
         """CBS 성능 데이터 생성"""
         print("CBS 성능 데이터 생성 중...")
         
-        # 다양한 부하 조건에서의 성능
-        load_conditions = [100, 300, 500, 700, 900]  # Mbps
-        
+        # 다양한 부하 조건에서의 성능 (모든 지표를 부하 벡터에 대한 배열 연산으로 계산)
+        loads = np.array([100, 300, 500, 700, 900])  # Mbps
+        
+        # CBS 적용 시
+        with_cbs = pd.DataFrame({
+            "load_mbps": loads,
+            "avg_latency_ms": 0.5 + (loads / 1000) * 0.3,
+            "max_latency_ms": 2.0 + (loads / 1000) * 1.0,
+            "jitter_ms": 0.1 + (loads / 1000) * 0.05,
+            "frame_loss_percent": np.maximum(0, (loads - 950) / 1000) * 2,
+            "throughput_mbps": np.minimum(loads, 950)
+        }, index=loads.astype(str))
+        
+        # CBS 미적용 시
+        without_cbs = pd.DataFrame({
+            "load_mbps": loads,
+            "avg_latency_ms": 5.0 + (loads / 100) * 2,
+            "max_latency_ms": 20.0 + (loads / 100) * 10,
+            "jitter_ms": 2.0 + (loads / 100) * 1,
+            "frame_loss_percent": np.maximum(0, (loads - 700) / 100) * 10,
+            "throughput_mbps": np.minimum(loads, 700)
+        }, index=loads.astype(str))
+        
+        # JSON 형식({부하: {지표: 값}})으로는 출력 시점에 한 번만 변환
         performance_data = {
-            "with_cbs": {},
-            "without_cbs": {}
+            "with_cbs": with_cbs.to_dict("index"),
+            "without_cbs": without_cbs.to_dict("index")
         }
-        
-        for load in load_conditions:
-            # CBS 적용 시
-            with_cbs = {
-                "load_mbps": load,
-                "avg_latency_ms": 0.5 + (load / 1000) * 0.3,
-                "max_latency_ms": 2.0 + (load / 1000) * 1.0,
-                "jitter_ms": 0.1 + (load / 1000) * 0.05,
-                "frame_loss_percent": max(0, (load - 950) / 1000) * 2,
-                "throughput_mbps": min(load, 950)
-            }
-            
-            # CBS 미적용 시
-            without_cbs = {
-                "load_mbps": load,
-                "avg_latency_ms": 5.0 + (load / 100) * 2,
-                "max_latency_ms": 20.0 + (load / 100) * 10,
-                "jitter_ms": 2.0 + (load / 100) * 1,
-                "frame_loss_percent": max(0, (load - 700) / 100) * 10,
-                "throughput_mbps": min(load, 700)
-            }
-            
-            performance_data["with_cbs"][str(load)] = with_cbs
-            performance_data["without_cbs"][str(load)] = without_cbs
             
         return performance_data
     
@@ -221,34 +232,32 @@ class RealTestDataGenerator:
         """장기 안정성 테스트 데이터"""
         print("장기 안정성 데이터 생성 중...")
         
-        data = []
-        start_time = datetime.now()
-        
-        for hour in range(168):  # 1주일
-            timestamp = start_time + timedelta(hours=hour)
-            
-            # 시간대별 트래픽 패턴
-            if 8 <= hour % 24 <= 20:  # 주간
-                load_factor = 0.8 + random.uniform(-0.1, 0.1)
-            else:  # 야간
-                load_factor = 0.4 + random.uniform(-0.1, 0.1)
-                
-            hourly_data = {
-                "timestamp": timestamp.isoformat(),
-                "hour": hour,
-                "load_mbps": 1000 * load_factor,
-                "avg_latency_ms": 0.5 + random.uniform(-0.1, 0.1),
-                "max_latency_ms": 2.0 + random.uniform(-0.5, 0.5),
-                "jitter_ms": 0.1 + random.uniform(-0.02, 0.02),
-                "frame_loss": random.randint(0, 10),
-                "credit_drift": random.uniform(-0.01, 0.01),
-                "memory_usage_mb": 50 + hour * 0.01 + random.uniform(-1, 1),
-                "cpu_usage_percent": 20 + load_factor * 30 + random.uniform(-5, 5)
-            }
-            
-            data.append(hourly_data)
-            
-        return data
+        n_hours = 168  # 1주일
+        rng = self.rng
+        hours = np.arange(n_hours)
+        
+        # 시간별 타임스탬프를 한 번의 datetime64 연산으로 계산
+        start_time = np.datetime64(datetime.now(), 'us')
+        timestamps = start_time + hours.astype('timedelta64[h]')
+        
+        # 시간대별 트래픽 패턴: 주간(8~20시) 0.8, 야간 0.4 (+-0.1)
+        is_day = (hours % 24 >= 8) & (hours % 24 <= 20)
+        load_factor = np.where(is_day, 0.8, 0.4) + rng.uniform(-0.1, 0.1, n_hours)
+        
+        df = pd.DataFrame({
+            "timestamp": np.datetime_as_string(timestamps, unit='us'),
+            "hour": hours,
+            "load_mbps": 1000 * load_factor,
+            "avg_latency_ms": 0.5 + rng.uniform(-0.1, 0.1, n_hours),
+            "max_latency_ms": 2.0 + rng.uniform(-0.5, 0.5, n_hours),
+            "jitter_ms": 0.1 + rng.uniform(-0.02, 0.02, n_hours),
+            "frame_loss": rng.integers(0, 10, n_hours, endpoint=True),
+            "credit_drift": rng.uniform(-0.01, 0.01, n_hours),
+            "memory_usage_mb": 50 + hours * 0.01 + rng.uniform(-1, 1, n_hours),
+            "cpu_usage_percent": 20 + load_factor * 30 + rng.uniform(-5, 5, n_hours)
+        })
+        
+        return df.to_dict("records")
     
     def generate_comparison_data(self) -> Dict:
         """비교 분석 데이터"""
@@ -307,51 +316,65 @@ class RealTestDataGenerator:
         n_samples = 10000
         
         # CBS 적용 시 지연시간 분포 (정규분포)
-        cbs_latencies = np.random.normal(0.5, 0.1, n_samples)
+        cbs_latencies = self.rng.normal(0.5, 0.1, n_samples)
         cbs_latencies = np.clip(cbs_latencies, 0.1, 2.0)
         
         # CBS 미적용 시 지연시간 분포 (지수분포)
-        no_cbs_latencies = np.random.exponential(5.0, n_samples)
+        no_cbs_latencies = self.rng.exponential(5.0, n_samples)
         no_cbs_latencies = np.clip(no_cbs_latencies, 0.5, 50.0)
         
+        # 분포마다 정렬은 한 번만 하고, 백분위수는 한 번의 호출로 함께 계산
+        cbs = self._latency_summary(cbs_latencies)
+        no_cbs = self._latency_summary(no_cbs_latencies)
+        
         analysis = {
-            "cbs": {
-                "mean": float(np.mean(cbs_latencies)),
-                "median": float(np.median(cbs_latencies)),
-                "std": float(np.std(cbs_latencies)),
-                "min": float(np.min(cbs_latencies)),
-                "max": float(np.max(cbs_latencies)),
-                "p50": float(np.percentile(cbs_latencies, 50)),
-                "p95": float(np.percentile(cbs_latencies, 95)),
-                "p99": float(np.percentile(cbs_latencies, 99)),
-                "p999": float(np.percentile(cbs_latencies, 99.9))
-            },
-            "no_cbs": {
-                "mean": float(np.mean(no_cbs_latencies)),
-                "median": float(np.median(no_cbs_latencies)),
-                "std": float(np.std(no_cbs_latencies)),
-                "min": float(np.min(no_cbs_latencies)),
-                "max": float(np.max(no_cbs_latencies)),
-                "p50": float(np.percentile(no_cbs_latencies, 50)),
-                "p95": float(np.percentile(no_cbs_latencies, 95)),
-                "p99": float(np.percentile(no_cbs_latencies, 99)),
-                "p999": float(np.percentile(no_cbs_latencies, 99.9))
-            },
+            "cbs": cbs,
+            "no_cbs": no_cbs,
             "improvement": {
-                "mean_reduction_percent": float((np.mean(no_cbs_latencies) - np.mean(cbs_latencies)) / np.mean(no_cbs_latencies) * 100),
-                "p99_reduction_percent": float((np.percentile(no_cbs_latencies, 99) - np.percentile(cbs_latencies, 99)) / np.percentile(no_cbs_latencies, 99) * 100),
-                "jitter_reduction_percent": float((np.std(no_cbs_latencies) - np.std(cbs_latencies)) / np.std(no_cbs_latencies) * 100)
+                "mean_reduction_percent": (no_cbs["mean"] - cbs["mean"]) / no_cbs["mean"] * 100,
+                "p99_reduction_percent": (no_cbs["p99"] - cbs["p99"]) / no_cbs["p99"] * 100,
+                "jitter_reduction_percent": (no_cbs["std"] - cbs["std"]) / no_cbs["std"] * 100
             }
         }
         
         return analysis
     
+    def _latency_summary(self, latencies: np.ndarray) -> Dict[str, float]:
+        """지연시간 샘플의 요약 통계 (정렬된 배열에서 최소/최대/백분위수를 읽음)"""
+        ordered = np.sort(latencies)
+        
+        # np.percentile의 선형 보간과 같은 값을 정렬된 배열의 인덱스에서 직접 계산 (재정렬 없음)
+        position = np.array([50, 95, 99, 99.9]) / 100 * (len(ordered) - 1)
+        lower = np.floor(position).astype(int)
+        upper = np.minimum(lower + 1, len(ordered) - 1)
+        p50, p95, p99, p999 = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+        
+        return {
+            "mean": float(ordered.mean()),
+            "median": float(p50),
+            "std": float(ordered.std()),
+            "min": float(ordered[0]),
+            "max": float(ordered[-1]),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "p999": float(p999)
+        }
+    
     def save_test_data(self, data: Dict, filename: str):
         """테스트 데이터 저장"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self._write_test_data(data, filename)
         print(f"✅ 데이터 저장: {filename}")
     
+    def _write_test_data(self, data: Dict, filename: str):
+        """데이터를 바이트로 한 번 직렬화한 뒤 큰 버퍼로 기록 (orjson이 있으면 NumPy 값까지 직접 처리)"""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+    
     def generate_all_test_data(self):
         """모든 테스트 데이터 생성"""
         print("\n" + "="*60)
@@ -373,14 +396,22 @@ class RealTestDataGenerator:
             "statistical_analysis": self.generate_statistical_analysis()
         }
         
-        # 메인 데이터 파일 저장
-        self.save_test_data(all_data, "real_test_data_1gbe.json")
+        # 메인 데이터 파일과 개별 데이터셋
+        outputs = {
+            "real_test_data_1gbe.json": all_data,
+            "cbs_performance_data.json": all_data["cbs_performance"],
+            "stability_test_168h.json": all_data["long_term_stability"],
+            "scenario_comparisons.json": all_data["comparison_scenarios"],
+            "statistical_analysis.json": all_data["statistical_analysis"]
+        }
         
-        # 개별 데이터셋 저장
-        self.save_test_data(all_data["cbs_performance"], "cbs_performance_data.json")
-        self.save_test_data(all_data["long_term_stability"], "stability_test_168h.json")
-        self.save_test_data(all_data["comparison_scenarios"], "scenario_comparisons.json")
-        self.save_test_data(all_data["statistical_analysis"], "statistical_analysis.json")
+        # 한 파일의 직렬화와 다른 파일의 디스크 쓰기가 겹치도록 스레드에서 동시에 저장
+        with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as executor:
+            futures = {filename: executor.submit(self._write_test_data, data, filename)
+                       for filename, data in outputs.items()}
+            for filename, future in futures.items():
+                future.result()
+                print(f"✅ 데이터 저장: {filename}")
         
         # 요약 통계
         print("\n📊 생성된 데이터 요약:")
@@ -391,7 +422,11 @@ class RealTestDataGenerator:
         
         # CSV 파일로도 저장 (분석용)
         df = pd.DataFrame(all_data["long_term_stability"])
-        df.to_csv("stability_test_168h.csv", index=False)
+        if pa is not None:
+            # pyarrow가 있으면 C++ CSV 작성기로 기록
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), "stability_test_168h.csv")
+        else:
+            df.to_csv("stability_test_168h.csv", index=False)
         print(f"✅ CSV 저장: stability_test_168h.csv")
         
         return all_data
@@ -17,6 +17,11 @@ import logging
 import json
 from pathlib import Path
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -50,6 +55,22 @@ class Frame:
         return self.priority > other.priority  # Higher priority first
 
 
+def _cbs_update_credit(credit: float, idle_slope: float, send_slope: float,
+                       hi_credit: float, lo_credit: float, time_delta: float,
+                       is_transmitting: bool) -> float:
+    """Integrate credit of a non-empty queue over time_delta, clamped to bounds"""
+    if is_transmitting:
+        return max(credit + send_slope * time_delta, lo_credit)
+    return min(credit + idle_slope * time_delta, hi_credit)
+
+
+if numba is not None:
+    # Explicit signature compiles eagerly at import, so callers never pay JIT warm-up
+    _cbs_update_credit = numba.njit(
+        'float64(float64, float64, float64, float64, float64, float64, boolean)',
+        cache=True, fastmath=True)(_cbs_update_credit)
+
+
 @dataclass
 class CBSQueue:
     """Credit-Based Shaper Queue implementation"""
@@ -68,12 +89,10 @@ class CBSQueue:
         
         if len(self.frames) == 0:
             self.credit = 0
-        elif is_transmitting:
-            self.credit += self.send_slope * time_delta
-            self.credit = max(self.credit, self.lo_credit)
         else:
-            self.credit += self.idle_slope * time_delta
-            self.credit = min(self.credit, self.hi_credit)
+            self.credit = _cbs_update_credit(
+                self.credit, self.idle_slope, self.send_slope,
+                self.hi_credit, self.lo_credit, time_delta, is_transmitting)
         
         self.last_update_time = current_time
     
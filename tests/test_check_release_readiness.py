@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Release Readiness Checker
+Tests for the hardcoded-secret scan in check_security_practices
+"""
+
+import pytest
+import re
+import sys
+from pathlib import Path
+
+# Add project root to Python path (check_release_readiness.py lives there)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from check_release_readiness import (
+    ReleaseReadinessChecker, _SENSITIVE_PATTERNS, _find_sensitive
+)
+
+
+def _assign(name, value):
+    """Build a `name = "value"` line at runtime so this file does not trip the scan itself"""
+    return f'{name} = "{value}"'
+
+
+# Quoted 24-character Base64-like value
+AWS_LIKE_KEY = 'AKIA2345' * 3
+API_KEY_LINE = _assign('api_key', AWS_LIKE_KEY)
+
+
+def _findall_categories(content):
+    """Categories reported by the original per-pattern re.findall scan"""
+    return [description for pattern, description in _SENSITIVE_PATTERNS
+            if re.findall(pattern, content, re.IGNORECASE)]
+
+
+class TestSecurityScan:
+    """Test suite for sensitive pattern detection"""
+
+    @pytest.mark.parametrize("content", [
+        API_KEY_LINE,
+        _assign('password', 'c2Vj' * 6),
+        _assign('token', 'dG9r' * 6) + '\n' + _assign('secret', 'x'),
+        _assign('PASSWORD', 'hunter2'),
+        _assign('name', 'short'),
+        _assign('padded', 'QUJD' * 5 + '=='),
+    ])
+    def test_matches_per_pattern_findall(self, content):
+        """Overlapping secrets report every category the findall scan reported"""
+        assert _find_sensitive(content) == _findall_categories(content)
+
+    def test_overlapping_api_key_reports_all_categories(self):
+        """A quoted Base64-like API key is reported as both an API key and a Base64 secret"""
+        assert _find_sensitive(API_KEY_LINE) == ['API 키', 'Base64 인코딩된 시크릿']
+
+    @pytest.mark.parametrize("content", [
+        "'generator': 'ProjectStatisticsGenerator'",
+        '"ReleaseReadinessCheckerFactory"',
+    ])
+    def test_quoted_class_name_not_flagged(self, content):
+        """A quoted CamelCase identifier is not reported as a Base64 secret"""
+        assert _find_sensitive(content) == []
+
+    def test_check_security_practices_reports_overlaps(self, tmp_path, monkeypatch):
+        """check_security_practices records one issue per matched category"""
+        (tmp_path / "config.py").write_text(API_KEY_LINE + '\n')
+        (tmp_path / "SECURITY.md").write_text("# Security\n")
+        monkeypatch.chdir(tmp_path)
+
+        checker = ReleaseReadinessChecker()
+        assert checker.check_security_practices() is False
+
+        result = checker.check_results['security']
+        assert result.issues_found == 2
+        assert result.has_security_md
+        assert sorted(checker.failed_checks) == sorted(
+            f"{Path('.') / 'config.py'}: {description}"
+            for description in _findall_categories(API_KEY_LINE)
+        )
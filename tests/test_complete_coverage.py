@@ -232,6 +232,26 @@ class TestCBSQueue(unittest.TestCase):
         self.assertIn('avg_frame_size', stats)
 
 
+class TestCBSCreditKernel(unittest.TestCase):
+    """Test the credit integration kernel behind CBSQueue.update_credit"""
+
+    def test_idle_accumulates_to_hi_credit(self):
+        """Test idle slope accumulation and HiCredit clamp"""
+        from src.network_simulator import _cbs_update_credit
+        self.assertAlmostEqual(
+            _cbs_update_credit(0.0, 750.0, -250.0, 2000.0, -1000.0, 1.0, False), 750.0)
+        self.assertEqual(
+            _cbs_update_credit(0.0, 750.0, -250.0, 2000.0, -1000.0, 10.0, False), 2000.0)
+
+    def test_transmit_drains_to_lo_credit(self):
+        """Test send slope drain and LoCredit clamp"""
+        from src.network_simulator import _cbs_update_credit
+        self.assertAlmostEqual(
+            _cbs_update_credit(0.0, 750.0, -250.0, 2000.0, -1000.0, 1.0, True), -250.0)
+        self.assertEqual(
+            _cbs_update_credit(0.0, 750.0, -250.0, 2000.0, -1000.0, 10.0, True), -1000.0)
+
+
 class TestNetworkSimulator(unittest.TestCase):
     """Complete test coverage for Network Simulator"""
     